@@ -0,0 +1,134 @@
+"""
+Card audio playback shared by live_qr_detector.py and poker_hand_reader.py.
+
+play_wav() picks the platform's player; on Linux the clips go through one
+persistent aplay process (AplayStream) with the decoded PCM cached per
+file, so repeat plays skip both the process start and the file read.
+"""
+
+import platform
+import subprocess
+import time
+import wave
+
+SYSTEM = platform.system()  # 'Darwin' for macOS, 'Linux' for Pi
+
+
+class AplayStream:
+    """
+    One long-running `aplay` process fed raw PCM on stdin, instead of
+    starting a new aplay (fork + exec + ALSA device open) for every card.
+
+    aplay needs the sample format on its command line, so the process is
+    restarted whenever a file's format differs from the running one; the
+    bundled clips all share one format, so in practice it starts once.
+    Decoded PCM is cached per file for the next time the card is played.
+    """
+
+    SAMPLE_FORMATS = {1: "U8", 2: "S16_LE", 3: "S24_3LE", 4: "S32_LE"}
+
+    def __init__(self):
+        self._proc = None
+        self._params = None    # (sample width, rate, channels) of _proc
+        self._pcm_cache = {}   # path -> (params, pcm bytes)
+
+    def _load(self, path: str):
+        cached = self._pcm_cache.get(path)
+        if cached is None:
+            with wave.open(path, "rb") as w:
+                params = (w.getsampwidth(), w.getframerate(), w.getnchannels())
+                if params[0] not in self.SAMPLE_FORMATS:
+                    raise wave.Error(f"unsupported sample width {params[0]}")
+                cached = (params, w.readframes(w.getnframes()))
+            self._pcm_cache[path] = cached
+        return cached
+
+    def play(self, path: str):
+        """
+        Play a PCM .wav file and return once it has been played (blocking,
+        like `aplay <file>`). Raises wave.Error/EOFError for files aplay
+        has to parse itself (compressed or malformed WAVs).
+        """
+        params, pcm = self._load(path)
+        if self._proc is None or self._proc.poll() is not None or params != self._params:
+            self.close()
+            width, rate, channels = params
+            self._proc = subprocess.Popen(
+                ["aplay", "-q", "-t", "raw", "-f", self.SAMPLE_FORMATS[width],
+                 "-r", str(rate), "-c", str(channels), "-"],
+                stdin=subprocess.PIPE,
+            )
+            self._params = params
+
+        start = time.monotonic()
+        try:
+            self._proc.stdin.write(pcm)
+            self._proc.stdin.flush()
+        except BrokenPipeError:
+            self.close()  # aplay died - reap it; restarted on the next call
+            raise
+        # The pipe and ALSA buffer the data, so wait out the clip length
+        width, rate, channels = params
+        remaining = len(pcm) / (width * rate * channels) - (time.monotonic() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def close(self):
+        """Let aplay drain what it has and exit (killed if it doesn't)."""
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=2.0)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+            self._proc.wait()  # reap it, or it lingers as a zombie
+        self._proc = None
+
+
+aplay_stream = AplayStream()
+
+
+def play_wav(path: str, report=print) -> bool:
+    """
+    Play a .wav file using platform-appropriate audio player.
+    - macOS: uses 'afplay'
+    - Linux/Raspberry Pi: uses 'aplay' (one persistent process, see AplayStream)
+    - Windows: uses 'start' command
+    This call is blocking: it waits until the audio finishes.
+
+    Problems are passed to report(msg), so each script can print them in
+    its own console style.
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        if SYSTEM == "Darwin":  # macOS
+            subprocess.run(["afplay", path], check=True)
+        elif SYSTEM == "Linux":
+            try:
+                aplay_stream.play(path)
+            except (wave.Error, EOFError):
+                # Not plain PCM - let aplay parse the file itself
+                subprocess.run(["aplay", path], check=True)
+        elif SYSTEM == "Windows":
+            subprocess.run(["start", "/WAIT", path], shell=True, check=True)
+        else:
+            report(f"Unsupported OS '{SYSTEM}'. Audio playback may not work.")
+            return False
+        return True
+    except FileNotFoundError:
+        if SYSTEM == "Darwin":
+            report("'afplay' not found. This is unusual on macOS.")
+        elif SYSTEM == "Linux":
+            report("'aplay' not found. Install ALSA utils with: sudo apt install alsa-utils")
+        else:
+            report(f"Audio player not found for OS '{SYSTEM}'")
+        return False
+    except subprocess.CalledProcessError as e:
+        report(f"Error playing {path}: Command failed with return code {e.returncode}")
+        return False
+    except Exception as e:
+        report(f"Error playing {path}: {e}")
+        return False
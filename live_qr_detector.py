@@ -11,10 +11,14 @@ Extra:
 """
 
 import argparse
+import re
 import time
 import os          # NEW
-import subprocess  # NEW
 import platform    # NEW - for OS detection
+import threading   # for the background frame grabber
+import functools   # lru_cache for text measurements
+import concurrent.futures  # background JPEG saves
+import contextlib  # camera / window cleanup
 
 # Detect if running on Raspberry Pi
 def is_raspberry_pi():
@@ -27,6 +31,7 @@ def is_raspberry_pi():
         return False
 
 IS_RASPBERRY_PI = is_raspberry_pi()
+SYSTEM = platform.system()  # 'Darwin' for macOS, 'Linux' for Pi
 DISPLAY_AVAILABLE = os.environ.get('DISPLAY') is not None
 
 # Console formatting helpers for uniform output
@@ -89,6 +94,16 @@ class ConsoleFormatter:
         spaces = " " * indent
         print(f"{spaces}• {msg}")
 
+# With --pin-cores, also keep OpenMP worker threads (if this OpenCV build
+# uses OpenMP) next to the main thread instead of letting them migrate. It
+# must be set before cv2 loads, so the flag is parsed here ahead of main();
+# only then, as every subprocess (aplay) inherits the variable. An argparse
+# pre-parser accepts the same spellings (e.g. "--pin") as main()'s parser.
+_pin_parser = argparse.ArgumentParser(add_help=False)
+_pin_parser.add_argument("--pin-cores", action="store_true")
+if _pin_parser.parse_known_args()[0].pin_cores:
+    os.environ.setdefault("OMP_PROC_BIND", "close")
+
 try:
     import cv2
 except ImportError:
@@ -105,11 +120,78 @@ except ImportError:
     print("  pip install numpy")
     exit(1)
 
+# Optional faster QR decoders (selected with --decoder)
+try:
+    from pyzbar import pyzbar
+    from pyzbar.pyzbar import ZBarSymbol
+    HAVE_PYZBAR = True
+except ImportError:  # also raised when the zbar shared library is missing
+    pyzbar = None
+    HAVE_PYZBAR = False
+
+try:
+    import zxingcpp
+    HAVE_ZXING = True
+except ImportError:
+    zxingcpp = None
+    HAVE_ZXING = False
+
+# Optional: Numba JIT for the per-QR corner math
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    njit = None
+    HAVE_NUMBA = False
+
+# Card audio playback (shared with poker_hand_reader.py)
+try:
+    from .audio_playback import aplay_stream, play_wav
+except ImportError:  # run as a script rather than as part of the package
+    from audio_playback import aplay_stream, play_wav
+
 # Path to audio_out folder (same level as this script)
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 AUDIO_DIR = os.path.join(SCRIPT_DIR, "audio_out")
 CARDS_FILE = os.path.join(SCRIPT_DIR, "detected_cards.txt")  # File to store detected cards
 
+# Static-scene gate: a 32x32 thumbnail of each frame is compared with the
+# previous one; if the summed absolute difference is below the threshold the
+# last detection result is reused instead of running the detector again.
+THUMB_SIZE = 32
+STATIC_FRAME_THRESHOLD = 2 * THUMB_SIZE * THUMB_SIZE  # ~2 grey levels per pixel
+MAX_REUSED_FRAMES = 15  # always re-detect at least this often
+
+# Temporal subsampling: between full detections, already-found QR corners are
+# followed with optical flow. A full detection runs every DETECT_EVERY frames,
+# or straight away if tracking is lost or moves more than MAX_TRACK_SHIFT px.
+DETECT_EVERY = 3
+MAX_TRACK_SHIFT = 20
+
+# Idle subsampling: after IDLE_MISS_STREAK detections in a row find nothing,
+# the detector only runs on every IDLE_DETECT_EVERY-th frame until a code is
+# seen again. Cards are laid down and held still, so this adds at most a
+# couple of frames of latency to the first detection.
+IDLE_MISS_STREAK = 10
+IDLE_DETECT_EVERY = 3
+
+# Region of interest: once codes are found, the next detections only search
+# their bounding box grown by ROI_MARGIN on each side. A full-frame scan runs
+# instead when the thumbnail shows changes outside the ROI (a card being
+# placed), when the ROI finds fewer codes than the last full scan, and in any
+# case every FULL_SCAN_EVERY detections.
+ROI_MARGIN = 0.5
+FULL_SCAN_EVERY = 30
+ROI_CHANGE_LEVEL = 16  # per-thumbnail-pixel grey difference that counts as change
+
+# Display throttle: cv2.imshow is costly on some platforms, and the window
+# does not need to refresh faster than the monitor. Keys are still polled
+# on every frame (without blocking on frames that are not shown).
+SHOW_INTERVAL = 1.0 / 30
+
+# cv2.pollKey (OpenCV >= 4.5) returns at once; waitKey(1) is the fallback
+poll_key = getattr(cv2, "pollKey", lambda: cv2.waitKey(1))
+
 
 def format_qr_data(data):
     """Format QR code data for display."""
@@ -126,40 +208,597 @@ def format_qr_data(data):
     return text
 
 
+@functools.lru_cache(maxsize=16)
+def _blend_matrix(color, alpha):
+    """
+    3x4 affine colour matrix for cv2.transform: out = (1 - alpha) * px +
+    alpha * color. Cached per (color, alpha) - there are only a handful.
+    """
+    m = np.zeros((3, 4), np.float32)
+    m[:, :3] = np.eye(3, dtype=np.float32) * (1.0 - alpha)
+    m[:, 3] = np.asarray(color, np.float32) * alpha
+    return m
+
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def _blend_const_numba(roi, cb, cg, cr, alpha_num):
+        """
+        Integer blend towards a constant colour, alpha in 1/256 steps.
+        Roughly 2x faster than cv2.transform on the small boxes drawn here.
+        """
+        keep = 256 - alpha_num
+        b = cb * alpha_num + 128  # +128 rounds to nearest
+        g = cg * alpha_num + 128
+        r = cr * alpha_num + 128
+        for y in range(roi.shape[0]):
+            for x in range(roi.shape[1]):
+                roi[y, x, 0] = (roi[y, x, 0] * keep + b) >> 8
+                roi[y, x, 1] = (roi[y, x, 1] * keep + g) >> 8
+                roi[y, x, 2] = (roi[y, x, 2] * keep + r) >> 8
+
+
+def blend_rect(img, pt1, pt2, color, alpha):
+    """
+    Draw a filled, semi-transparent rectangle onto img IN PLACE.
+
+    Equivalent to drawing the rectangle on a full-frame copy and calling
+    cv2.addWeighted(overlay, alpha, img, 1 - alpha, 0, img), but only the
+    pixels inside the rectangle are touched, and no overlay/scratch buffer
+    is needed at all: the blend is a single per-pixel affine transform
+    written straight back into the ROI.
+    """
+    h, w = img.shape[:2]
+    # cv2.rectangle treats pt2 as inclusive, so +1 on the far edge
+    x1, y1 = max(pt1[0], 0), max(pt1[1], 0)
+    x2, y2 = min(pt2[0] + 1, w), min(pt2[1] + 1, h)
+    if x1 >= x2 or y1 >= y2:
+        return
+
+    roi = img[y1:y2, x1:x2]
+    if HAVE_NUMBA:
+        _blend_const_numba(roi, color[0], color[1], color[2], int(alpha * 256 + 0.5))
+    else:
+        cv2.transform(roi, _blend_matrix(tuple(color), alpha), dst=roi)
+
+
+@functools.lru_cache(maxsize=256)
+def get_text_size(text, font, font_scale, thickness):
+    """cv2.getTextSize, memoized - QR labels repeat on every frame."""
+    return cv2.getTextSize(text, font, font_scale, thickness)
+
+
+class TextOverlay:
+    """
+    Text lines that only change occasionally (e.g. "Scale: 0.75x"), rendered
+    once and re-applied to every frame.
+
+    The lines are drawn with cv2.putText onto a blank canvas the size of the
+    frame; the drawn pixels' positions and colours are kept, and draw() then
+    writes them into the frame with a single NumPy assignment instead of
+    re-rasterizing the glyphs. The result is pixel-identical to calling
+    cv2.putText on the frame directly.
+    """
+
+    def __init__(self):
+        self._key = None
+        self._idx = None      # flat pixel indices of the rendered text
+        self._colors = None   # BGR value for each of those pixels
+
+    def draw(self, img, make_lines, *args):
+        """
+        Apply the overlay to img in place.
+
+        make_lines(*args) must return a list of cv2.putText argument tuples
+        (text, org, font, font_scale, color, thickness). It is only called
+        when args (or the frame size) differ from the previous call.
+        """
+        key = (args, img.shape)
+        if key != self._key:
+            canvas = np.zeros_like(img)
+            drawn = np.zeros(img.shape[:2], dtype=np.uint8)
+            for text, org, font, font_scale, color, thickness in make_lines(*args):
+                cv2.putText(canvas, text, org, font, font_scale, color, thickness)
+                cv2.putText(drawn, text, org, font, font_scale, 255, thickness)
+            self._idx = np.flatnonzero(drawn)
+            self._colors = canvas.reshape(-1, img.shape[2])[self._idx]
+            self._key = key
+
+        if self._idx.size == 0:
+            return
+        if img.flags.c_contiguous:
+            img.reshape(-1, img.shape[2])[self._idx] = self._colors
+        else:
+            # reshape() would copy a non-contiguous view - draw directly
+            for line in make_lines(*args):
+                cv2.putText(img, *line)
+
+
+def static_hud_lines(scale: float, debug_mode: bool):
+    """HUD labels that only change when --scale or debug mode changes."""
+    lines = []
+    if scale != 1.0:
+        lines.append((f"Scale: {scale}x", (10, 90), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (128, 128, 128), 1))
+    if debug_mode:
+        lines.append(("Debug Mode: ON", (10, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.6, DEBUG_COLOR, 2))
+    return lines
+
+
+def status_text_lines(num_qrs: int, num_cards: int):
+    """
+    Top status line. Built from the counts only when they change (the
+    TextOverlay cache key), so no string is formatted on other frames.
+    """
+    info_text = f"Detected QR codes this frame: {num_qrs}"
+    if num_cards >= 5:
+        info_text += " | HAND COMPLETE! (5/5 cards)"
+    elif num_cards == 4:
+        info_text += " | TURN DETECTED! (4/5 cards)"
+    elif num_cards == 3:
+        info_text += " | FLOP DETECTED! (3/5 cards)"
+    else:
+        info_text += f" | Unique cards seen: {num_cards}/5"
+    return [(info_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)]
+
+
+def progress_text_lines(num_cards: int, y: int):
+    """Pre-flop "Poker: n/5" line; the text is only built when n changes."""
+    return [(f"Poker: {num_cards}/5 unique cards detected", (10, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)]
+
+
+# Per-frame drawing style (QR outlines/labels and the live counters)
+QR_OUTLINE_COLOR = (0, 255, 0)           # outline and label text
+QR_CORNER_COLOR = (255, 0, 0)
+QR_LABEL_BG_COLOR = (0, 0, 0)
+QR_LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX
+QR_LABEL_SCALE = 0.5
+COUNTER_FONT = cv2.FONT_HERSHEY_PLAIN    # cheapest Hershey font; redrawn every frame
+FRAME_COUNTER_COLOR = (255, 255, 255)
+DEBUG_COLOR = (0, 165, 255)              # "Debug Mode" label and FPS readout
+
+# Banner box per poker stage: (height above the bottom edge, colour)
+BANNER_FLOP = (120, (0, 255, 0))
+BANNER_TURN = (160, (0, 165, 255))
+BANNER_RIVER = (180, (255, 0, 255))
+
+# Banner text layout, as y offsets from the top of the box
+BANNER_FONT = cv2.FONT_HERSHEY_SIMPLEX
+BANNER_TEXT_COLOR = (255, 255, 255)
+BANNER_TITLE_Y = 25
+BANNER_FLOP_CARD_Y = (50, 75, 100)       # flop only: big card lines
+BANNER_FLOP_LABEL_Y = 50                 # turn/river: "Flop:" + small lines
+BANNER_SMALL_CARD_Y = (70, 90, 110)
+BANNER_TURN_Y = 135
+BANNER_RIVER_Y = 155
+BANNER_CARD_CHARS = 30                   # longer QR payloads are cut off
+
+
+def poker_banner_lines(h: int, flop_cards: tuple, turn_card, river_card):
+    """
+    Title and card lines for the flop/turn/river banner at the bottom of the
+    frame. Only changes when a card is added or the hand is reset, so it is
+    drawn through a TextOverlay.
+    """
+    font, white, n = BANNER_FONT, BANNER_TEXT_COLOR, BANNER_CARD_CHARS
+    if turn_card is None:
+        (box_height, color), title = BANNER_FLOP, "FLOP DETECTED!"
+    elif river_card is None:
+        (box_height, color), title = BANNER_TURN, "TURN DETECTED!"
+    else:
+        (box_height, color), title = BANNER_RIVER, "HAND COMPLETE!"
+    top = h - box_height
+    lines = [(title, (20, top + BANNER_TITLE_Y), font, 0.7, color, 2)]
+
+    if turn_card is None:
+        for i, (card, y) in enumerate(zip(flop_cards, BANNER_FLOP_CARD_Y)):
+            lines.append((f"Card {i+1}: {card[:n]}", (20, top + y), font, 0.6, white, 2))
+        return lines
+
+    lines.append(("Flop:", (20, top + BANNER_FLOP_LABEL_Y), font, 0.5, white, 1))
+    for i, (card, y) in enumerate(zip(flop_cards, BANNER_SMALL_CARD_Y)):
+        lines.append((f"  Card {i+1}: {card[:n]}", (20, top + y), font, 0.5, white, 1))
+    lines.append((f"Turn:  {turn_card[:n]}", (20, top + BANNER_TURN_Y), font, 0.5, white, 1))
+    if river_card is not None:
+        lines.append((f"River: {river_card[:n]}", (20, top + BANNER_RIVER_Y), font, 0.5, white, 1))
+    return lines
+
+
+def draw_qr_annotation(img, pts_array, text_x, text_y, text):
+    """
+    Outline one QR code with corner dots, plus its text on a dark label box
+    anchored at (text_x, text_y). pts_array is int32 corners in img
+    coordinates.
+    """
+    cv2.polylines(img, [pts_array], True, QR_OUTLINE_COLOR, 2)
+
+    # Corner dots: a zero-length segment drawn 10px thick is a filled
+    # radius-5 circle, so all 4 go in a single call
+    corners = np.repeat(pts_array[:, None, :], 2, axis=1)
+    cv2.polylines(img, corners, False, QR_CORNER_COLOR, 10)
+
+    label = text[:50]
+    if len(text) > 50:
+        label += "..."
+
+    (text_width, text_height), baseline = get_text_size(label, QR_LABEL_FONT, QR_LABEL_SCALE, 1)
+    blend_rect(
+        img,
+        (text_x, text_y - text_height - 5),
+        (text_x + text_width + 5, text_y + baseline + 5),
+        QR_LABEL_BG_COLOR,
+        0.7,
+    )
+    cv2.putText(img, label, (text_x, text_y), QR_LABEL_FONT, QR_LABEL_SCALE, QR_OUTLINE_COLOR, 1)
+
+
+def draw_poker_banner(img, overlay: TextOverlay, flop_cards: tuple, turn_card, river_card):
+    """
+    Translucent flop/turn/river box at the bottom of img with the cards on
+    it. The box depends on the frame underneath, so it is blended every
+    frame; the text comes from overlay's cached template until the next
+    card arrives.
+    """
+    h, w = img.shape[:2]
+    if river_card is not None:
+        box_height, box_color = BANNER_RIVER
+    elif turn_card is not None:
+        box_height, box_color = BANNER_TURN
+    else:
+        box_height, box_color = BANNER_FLOP
+    blend_rect(img, (10, h - box_height), (w - 10, h - 10), box_color, 0.3)
+    overlay.draw(img, poker_banner_lines, h, flop_cards, turn_card, river_card)
+
+
+def alloc_processing_buffers(frame_shape, scale: float):
+    """
+    Allocate the single-channel buffers the detector reads from.
+
+    Returns (gray_buf, small_buf): gray_buf matches the frame size, small_buf
+    is the downscaled size for --scale (None when scale is 1.0).
+    """
+    h, w = frame_shape[:2]
+    gray_buf = np.empty((h, w), dtype=np.uint8)
+    small_buf = None
+    if scale != 1.0:
+        small_buf = np.empty((max(1, int(h * scale)), max(1, int(w * scale))), dtype=np.uint8)
+    return gray_buf, small_buf
+
+
+# ---------- QR DECODERS ---------- #
+# Each decoder takes a grayscale image and returns (retval, decoded_info,
+# points) in the same layout as cv2.QRCodeDetector.detectAndDecodeMulti:
+# points is an (N, 4, 2) float32 array of corners, or None if nothing found.
+
+def decode_pyzbar(img):
+    """Decode QR codes with zbar (QR symbology only - no 1D barcode scan)."""
+    results = pyzbar.decode(img, symbols=[ZBarSymbol.QRCODE])
+    if not results:
+        return False, (), None
+
+    decoded_info = []
+    corners = []
+    for r in results:
+        poly = r.polygon
+        if len(poly) != 4:
+            # Fall back to the bounding rectangle
+            left, top, width, height = r.rect
+            poly = [(left, top), (left + width, top), (left + width, top + height), (left, top + height)]
+        decoded_info.append(r.data)  # bytes - format_qr_data decodes it
+        corners.append([(p[0], p[1]) for p in poly])
+    return True, tuple(decoded_info), np.array(corners, dtype=np.float32)
+
+
+def decode_zxing(img):
+    """Decode QR codes with zxing-cpp."""
+    results = zxingcpp.read_barcodes(img, formats=zxingcpp.BarcodeFormat.QRCode)
+    if not results:
+        return False, (), None
+
+    decoded_info = []
+    corners = []
+    for r in results:
+        pos = r.position
+        decoded_info.append(r.text)
+        corners.append([
+            (pos.top_left.x, pos.top_left.y),
+            (pos.top_right.x, pos.top_right.y),
+            (pos.bottom_right.x, pos.bottom_right.y),
+            (pos.bottom_left.x, pos.bottom_left.y),
+        ])
+    return True, tuple(decoded_info), np.array(corners, dtype=np.float32)
+
+
+def make_qr_decoder(name: str, use_opencl: bool = False):
+    """
+    Return a decode(img) -> (retval, decoded_info, points) callable for the
+    requested backend, falling back to OpenCV if that library is missing.
+
+    With use_opencl, the OpenCV decoder is fed a cv2.UMat so the parts of
+    the detector that have OpenCL kernels run through the transparent API.
+    """
+    if name == "pyzbar":
+        if HAVE_PYZBAR:
+            return decode_pyzbar
+        ConsoleFormatter.warning("pyzbar is not available - falling back to OpenCV decoder.")
+        ConsoleFormatter.info("Install with: pip install pyzbar  (and: sudo apt install libzbar0)", indent=3)
+    elif name == "zxing":
+        if HAVE_ZXING:
+            return decode_zxing
+        ConsoleFormatter.warning("zxing-cpp is not available - falling back to OpenCV decoder.")
+        ConsoleFormatter.info("Install with: pip install zxing-cpp", indent=3)
+
+    qr_detector = cv2.QRCodeDetector()
+
+    def decode_opencv(img):
+        retval, decoded_info, points, _ = qr_detector.detectAndDecodeMulti(img)
+        return retval, decoded_info, points
+
+    def decode_opencv_umat(img):
+        retval, decoded_info, points, _ = qr_detector.detectAndDecodeMulti(cv2.UMat(img))
+        if isinstance(points, cv2.UMat):
+            points = points.get()
+        return retval, decoded_info, points
+
+    return decode_opencv_umat if use_opencl else decode_opencv
+
+
+def enable_opencl() -> bool:
+    """Turn on OpenCV's OpenCL (T-API) path if a device is available."""
+    if not cv2.ocl.haveOpenCL():
+        ConsoleFormatter.warning("OpenCL requested but no OpenCL device is available - using CPU.")
+        return False
+    cv2.ocl.setUseOpenCL(True)
+    if not cv2.ocl.useOpenCL():
+        ConsoleFormatter.warning("OpenCV could not enable OpenCL - using CPU.")
+        return False
+    ConsoleFormatter.success("OpenCL enabled for QR detection")
+    return True
+
+
+def physical_core_cpus():
+    """
+    One logical CPU per physical core (Linux only), e.g. [0, 2, 4, 6] on a
+    4-core CPU with hyper-threading, or every CPU on a Pi. Returns None if
+    the topology can't be read.
+    """
+    try:
+        allowed = os.sched_getaffinity(0)
+    except (AttributeError, OSError):
+        return None
+
+    cpus = set()
+    for cpu in sorted(allowed):
+        path = f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list"
+        try:
+            with open(path) as f:
+                siblings = f.read().strip()
+        except OSError:
+            return None
+        # "0,4" or "0-1": the first sibling stands for the whole core
+        first = int(siblings.replace("-", ",").split(",")[0])
+        cpus.add(first if first in allowed else cpu)
+    return sorted(cpus)
+
+
+def configure_threads(num_threads, pin_cores=False):
+    """
+    Size OpenCV's parallel_for_ pool (used inside the QR detector).
+
+    num_threads 0 means one thread per physical core: hyper-threaded
+    siblings share caches, and running the finder-pattern scan on both
+    tends to be slower than on one. With pin_cores (Linux only) the process
+    is also pinned to one CPU per physical core so the threads don't share
+    one; that affinity is inherited by child processes, hence opt-in.
+    """
+    cpus = physical_core_cpus()
+    if num_threads <= 0:
+        if cpus is None:
+            num_threads = max(1, (os.cpu_count() or 2) // 2)
+        else:
+            num_threads = len(cpus)
+    if pin_cores:
+        if cpus is None:
+            ConsoleFormatter.warning("--pin-cores: CPU topology not available - not pinning.")
+        elif len(cpus) < len(os.sched_getaffinity(0)):
+            try:
+                os.sched_setaffinity(0, cpus)
+            except OSError:
+                pass  # not allowed here - threads just aren't pinned
+    cv2.setNumThreads(num_threads)
+    # SIMD-dispatched code paths; on by default, but a site-wide
+    # cv2.setUseOptimized(False) would silently cost a lot here
+    cv2.setUseOptimized(True)
+    return num_threads
+
+
+def _scale_corners_numpy(pts, inv_scale):
+    """NumPy version of scale_corners (used when Numba is not installed)."""
+    pts_array = (pts * inv_scale).astype(np.int32)
+    text_x, text_y = pts_array.min(axis=0).tolist()
+    return pts_array, text_x, text_y - 10
+
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def _scale_corners_numba(pts, inv_scale):
+        """Numba version of scale_corners: one pass, no temporaries."""
+        n = pts.shape[0]
+        pts_array = np.empty((n, 2), dtype=np.int32)
+        min_x = np.iinfo(np.int32).max
+        min_y = np.iinfo(np.int32).max
+        for i in range(n):
+            x = np.int32(pts[i, 0] * inv_scale)
+            y = np.int32(pts[i, 1] * inv_scale)
+            pts_array[i, 0] = x
+            pts_array[i, 1] = y
+            if x < min_x:
+                min_x = x
+            if y < min_y:
+                min_y = y
+        return pts_array, min_x, min_y - 10
+
+
+def scale_corners(pts, inv_scale):
+    """
+    Map detector corners back to display coordinates.
+
+    Args:
+        pts: (4, 2) float32 corner array from the detector
+        inv_scale: 1 / --scale
+
+    Returns:
+        (pts_array, text_x, text_y): int32 corners for drawing, and the
+        label anchor just above the top-left of the code.
+    """
+    if HAVE_NUMBA:
+        x = _scale_corners_numba(pts, inv_scale)
+        return x[0], int(x[1]), int(x[2])
+    return _scale_corners_numpy(pts, inv_scale)
+
+
+def native_corners(pts, inv_scale=None):
+    """
+    scale_corners for --scale 1.0: detector and display coordinates are the
+    same, so there is nothing to multiply - just truncate to int32.
+    """
+    pts_array = pts.astype(np.int32, copy=False)
+    text_x, text_y = pts_array.min(axis=0).tolist()
+    return pts_array, text_x, text_y - 10
+
+
+def downscale_gray(gray, small_buf):
+    """Shrink the grayscale frame into small_buf for the detector (--scale)."""
+    return cv2.resize(
+        gray,
+        (small_buf.shape[1], small_buf.shape[0]),
+        dst=small_buf,
+        interpolation=cv2.INTER_AREA,
+    )
+
+
+def native_gray(gray, small_buf=None):
+    """--scale 1.0: the detector runs on the full-size grayscale frame."""
+    return gray
+
+
+def roi_from_points(points, img_shape):
+    """
+    Bounding box (x, y, w, h) around all detected corners, grown by
+    ROI_MARGIN of its size on each side and clipped to the image.
+    """
+    x, y, w, h = cv2.boundingRect(points.reshape(-1, 2).astype(np.float32))
+    dx, dy = int(w * ROI_MARGIN), int(h * ROI_MARGIN)
+    img_h, img_w = img_shape[:2]
+    x0, y0 = max(0, x - dx), max(0, y - dy)
+    x1, y1 = min(img_w, x + w + dx), min(img_h, y + h + dy)
+    return x0, y0, x1 - x0, y1 - y0
+
+
+def changed_outside_roi(thumb, prev_thumb, roi, img_shape):
+    """True if the scene changed anywhere outside roi since prev_thumb."""
+    changed = cv2.absdiff(thumb, prev_thumb) > ROI_CHANGE_LEVEL
+    # Blank out the ROI, mapped from image to thumbnail coordinates
+    x, y, w, h = roi
+    img_h, img_w = img_shape[:2]
+    th, tw = thumb.shape
+    changed[
+        y * th // img_h : -(-(y + h) * th // img_h),
+        x * tw // img_w : -(-(x + w) * tw // img_w),
+    ] = False
+    return bool(changed.any())
+
+
+def count_decoded(retval, decoded_info):
+    """Number of QR codes that actually decoded to some data."""
+    if not retval:
+        return 0
+    return sum(1 for data in decoded_info if data)
+
+
+def decode_in_roi(decode, img, roi, min_found):
+    """
+    Run decode on the roi (x, y, w, h) of img only.
+
+    Returns decode's (retval, decoded_info, points) with points moved back to
+    full-image coordinates, or None if the ROI decoded fewer than min_found
+    codes (or none at all) - the caller should then scan the whole image.
+    """
+    x, y, w, h = roi
+    retval, decoded_info, points = decode(img[y:y + h, x:x + w])
+    # retval can be True for codes that were located but not decoded, so a
+    # full scan may have counted 0; an empty ROI result must still fall back
+    if retval and count_decoded(retval, decoded_info) >= min_found:
+        return retval, decoded_info, points + np.float32((x, y))
+    return None
+
+
+def track_qr_points(prev_img, next_img, points):
+    """
+    Follow previously detected QR corners from prev_img into next_img using
+    pyramidal Lucas-Kanade optical flow.
+
+    Returns the moved points (same shape as points), or None if any corner
+    was lost or jumped further than MAX_TRACK_SHIFT - the caller should then
+    run a full detection.
+    """
+    prev_pts = points.reshape(-1, 1, 2).astype(np.float32)
+    next_pts, status, _ = cv2.calcOpticalFlowPyrLK(
+        prev_img, next_img, prev_pts, None, winSize=(21, 21), maxLevel=2
+    )
+    if next_pts is None or not status.all():
+        return None
+    if np.abs(next_pts - prev_pts).max() > MAX_TRACK_SHIFT:
+        return None
+    return next_pts.reshape(points.shape)
+
+
+def wait_opened(cap, timeout: float) -> bool:
+    """
+    Poll cap.isOpened() with exponential backoff from 10 ms, giving up
+    after timeout seconds. Returns as soon as the device is open instead of
+    always sleeping for the worst case.
+    """
+    delay = 0.01
+    deadline = time.monotonic() + timeout
+    while not cap.isOpened():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 0.1)
+    return True
+
+
 def open_camera(idx: int):
     """
     Try to open the camera using a few backends.
-    On Raspberry Pi / Linux, CAP_V4L2 is usually best for USB webcams.
-    Also supports libcamera for Raspberry Pi Camera Module.
+    On Linux the V4L2 device node (/dev/videoN) is opened by path first:
+    opening by index can bind to a metadata node on some V4L2 stacks and
+    end up in the slow fallback path. Also supports libcamera for Raspberry
+    Pi Camera Module.
     """
     backend_candidates = []
 
-    # On Raspberry Pi, try libcamera first (for Pi Camera Module)
-    if IS_RASPBERRY_PI:
-        # Try libcamera backend (for Pi Camera Module v3/v2)
-        if hasattr(cv2, "CAP_V4L2"):
-            # Try libcamera device path
-            libcamera_paths = [
-                f"/dev/video{idx}",
-                "/dev/video0",
-                "/dev/video1",
-            ]
-            for path in libcamera_paths:
-                if os.path.exists(path):
-                    try:
-                        print(f"Trying libcamera at {path}...")
-                        cap = cv2.VideoCapture(path, cv2.CAP_V4L2)
-                        time.sleep(0.3)  # Give libcamera more time to initialize
-                        if cap is not None and cap.isOpened():
-                            ret, _ = cap.read()
-                            if ret:
-                                print(f"✅ Opened libcamera at {path}")
-                                return cap
-                            cap.release()
-                    except Exception as e:
-                        print(f"  libcamera attempt failed: {e}")
+    if hasattr(cv2, "CAP_V4L2") and SYSTEM == "Linux":
+        device_paths = [f"/dev/video{idx}"]
+        if IS_RASPBERRY_PI:
+            # libcamera (Pi Camera Module v3/v2) may sit on another node
+            device_paths += [p for p in ("/dev/video0", "/dev/video1") if p not in device_paths]
+        for path in device_paths:
+            if os.path.exists(path):
+                try:
+                    print(f"Trying {path} with V4L2...")
+                    cap = cv2.VideoCapture(path, cv2.CAP_V4L2)
+                    if cap is not None and wait_opened(cap, 0.3):
+                        ret, _ = cap.read()
+                        if ret:
+                            print(f"✅ Opened camera at {path}")
+                            return cap
+                    if cap is not None:
+                        cap.release()
+                except Exception as e:
+                    print(f"  {path} attempt failed: {e}")
 
-    # Prefer V4L2 on Linux / Pi for USB webcams
+    # Then by index: V4L2 first on Linux / Pi for USB webcams
     if hasattr(cv2, "CAP_V4L2"):
         backend_candidates.append(cv2.CAP_V4L2)
 
@@ -170,8 +809,7 @@ def open_camera(idx: int):
         print(f"Trying to open camera {idx} with backend {backend}...")
         cap = cv2.VideoCapture(idx, backend)
         # Give the backend a moment to actually open the device
-        time.sleep(0.2)
-        if cap is not None and cap.isOpened():
+        if cap is not None and wait_opened(cap, 0.2):
             print(f"✅ Opened camera {idx} with backend {backend}")
             return cap
         else:
@@ -183,8 +821,155 @@ def open_camera(idx: int):
     return None
 
 
+# --display-backend gst: frames go straight to the Jetson video overlay
+# (no X11 blit). nvvidconv does the colour conversion on the GPU.
+GST_DISPLAY_PIPELINE = (
+    "appsrc ! videoconvert ! nvvidconv ! "
+    "video/x-raw(memory:NVMM),format=I420 ! nvoverlaysink sync=false"
+)
+
+
+def open_display(backend: str, window_name: str, frame_shape):
+    """
+    Prepare the display for the chosen --display-backend.
+
+    Returns a cv2.VideoWriter for "gst" (frames are written to it instead of
+    cv2.imshow), or None when frames go through cv2.imshow ("cv", "gl", or a
+    backend that turned out to be unavailable).
+    """
+    if backend == "gst":
+        h, w = frame_shape[:2]
+        writer = cv2.VideoWriter(GST_DISPLAY_PIPELINE, cv2.CAP_GSTREAMER, 0, 30.0, (w, h))
+        if writer.isOpened():
+            ConsoleFormatter.success("Displaying through GStreamer (nvoverlaysink)")
+            ConsoleFormatter.info("Keys are not available on the overlay - press Ctrl+C to quit")
+            return writer
+        ConsoleFormatter.warning("GStreamer display pipeline failed to open - using cv2.imshow")
+        backend = "cv"
+
+    if backend == "gl":
+        try:
+            # OpenGL windows upload the frame as a texture instead of a CPU blit
+            cv2.namedWindow(window_name, cv2.WINDOW_OPENGL | cv2.WINDOW_AUTOSIZE)
+            return None
+        except cv2.error:
+            ConsoleFormatter.warning("This OpenCV build has no OpenGL support - using a normal window")
+
+    cv2.namedWindow(window_name, cv2.WINDOW_AUTOSIZE)
+    return None
+
+
+class FrameGrabber:
+    """
+    Capture frames on a background thread, keeping only the newest one.
+
+    The camera read (which blocks for a whole frame interval) then overlaps
+    with QR detection on the main thread instead of running in series with
+    it. This is a single slot, not a queue: a frame that arrives before the
+    previous one was consumed simply replaces it, so we never fall behind.
+
+    Frames are decoded into a ring of 3 reused buffers instead of a new
+    array per frame: one the main thread is drawing on (the last read()),
+    one published as the newest, and one being filled.
+    """
+
+    NUM_BUFFERS = 3
+
+    def __init__(self, cap):
+        self.cap = cap
+        self._cond = threading.Condition()
+        self._bufs = [None] * self.NUM_BUFFERS
+        self._latest = -1      # slot of the newest published frame
+        self._held = -1        # slot handed out by the last read()
+        self._seq = 0          # bumped for every frame published
+        self._ok = True        # False once the camera stops delivering
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, name="FrameGrabber", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            if self.cap.grab():
+                with self._cond:
+                    slot = next(
+                        i for i in range(self.NUM_BUFFERS)
+                        if i != self._latest and i != self._held
+                    )
+                # Decodes in place when the size matches (allocates only on
+                # the first frames or after a resolution change)
+                ret, frame = self.cap.retrieve(self._bufs[slot])
+            else:
+                ret, frame = False, None
+
+            with self._cond:
+                if self._stop:
+                    return
+                if not ret or frame is None:
+                    self._ok = False
+                    self._cond.notify_all()
+                    return
+                # Nobody else touches this slot until it is published
+                self._bufs[slot] = frame
+                self._latest = slot
+                self._seq += 1
+                self._cond.notify_all()
+
+    def read(self, last_seq: int):
+        """
+        Wait for a frame newer than last_seq.
+
+        Returns (ret, frame, seq) like cap.read(), plus the sequence number
+        to pass back in on the next call. The frame stays untouched by the
+        grabber until the next read(), so it can be drawn on in place.
+        """
+        with self._cond:
+            while self._ok and self._seq == last_seq:
+                # Timed wait so Ctrl+C is still delivered promptly
+                self._cond.wait(timeout=0.5)
+            if self._seq == last_seq:
+                return False, None, last_seq
+            self._held = self._latest
+            return True, self._bufs[self._latest], self._seq
+
+    def stop(self):
+        """
+        Stop the capture thread and wait until it has exited: the capture
+        must not be released while the thread is inside grab()/retrieve().
+        Does nothing if the thread was never started.
+        """
+        with self._cond:
+            self._stop = True
+        if self._thread.ident is not None:
+            # No timeout: a stalled grab() still returns once the backend's
+            # own read timeout expires, and the thread then sees _stop
+            self._thread.join()
+
+
+def save_frame(filename: str, frame):
+    """
+    Write frame as a JPEG and report the result ('s' key). Runs on the save
+    pool, so the outcome is printed here - nobody waits on the future.
+    """
+    try:
+        ok = cv2.imwrite(filename, frame)
+    except Exception as e:  # an exception in the pool would be lost silently
+        ConsoleFormatter.error(f"Failed to save frame to {filename}: {e}")
+        return
+    if ok:
+        print(f"Saved frame to {filename}")
+    else:
+        ConsoleFormatter.error(f"Failed to save frame to {filename}")
+
+
 # ---------- AUDIO HELPERS ---------- #
 
+# Leading run of letters/digits (\w without "_", i.e. str.isalnum())
+CARD_CODE_RE = re.compile(r"[^\W_]+")
+
+
 def extract_card_code(card_str: str) -> str:
     """
     Extract a card code suitable for filename from the card string.
@@ -195,52 +980,26 @@ def extract_card_code(card_str: str) -> str:
       "  as  "     -> "AS"
     We take leading alphanumeric characters, uppercase them.
     """
-    s = card_str.strip().upper()
-    code = ""
-    for ch in s:
-        if ch.isalnum():
-            code += ch
-        else:
-            break
-    return code
+    m = CARD_CODE_RE.match(card_str.strip().upper())
+    return m.group(0) if m else ""
 
 
-def play_wav(path: str):
+def scan_audio_files():
     """
-    Play a .wav file using platform-appropriate audio player.
-    - macOS: uses 'afplay'
-    - Linux/Raspberry Pi: uses 'aplay'
-    - Windows: uses 'start' command
-    This call is blocking: it waits until the audio finishes.
+    Map of card code -> .wav file name in AUDIO_DIR, read with a single
+    os.scandir. Case-insensitive, so "as.WAV" serves card "AS". Returns None
+    if the directory is missing. Scanned on every '1' press, so files added
+    while running are picked up.
     """
-    system = platform.system()
-    
     try:
-        if system == "Darwin":  # macOS
-            subprocess.run(["afplay", path], check=True)
-        elif system == "Linux":
-            subprocess.run(["aplay", path], check=True)
-        elif system == "Windows":
-            subprocess.run(["start", "/WAIT", path], shell=True, check=True)
-        else:
-            print(f"Warning: Unsupported OS '{system}'. Audio playback may not work.")
-            return False
-        return True
-    except FileNotFoundError:
-        if system == "Darwin":
-            print(f"Error: 'afplay' not found. This is unusual on macOS.")
-        elif system == "Linux":
-            print("Error: 'aplay' not found. Install ALSA utils with:")
-            print("  sudo apt install alsa-utils")
-        else:
-            print(f"Error: Audio player not found for OS '{system}'")
-        return False
-    except subprocess.CalledProcessError as e:
-        print(f"Error playing {path}: Command failed with return code {e.returncode}")
-        return False
-    except Exception as e:
-        print(f"Error playing {path}: {e}")
-        return False
+        with os.scandir(AUDIO_DIR) as entries:
+            return {
+                e.name[:-4].upper(): e.name
+                for e in entries
+                if e.name.lower().endswith(".wav") and e.is_file()
+            }
+    except OSError:
+        return None
 
 
 def play_cards_audio(card_order):
@@ -253,8 +1012,9 @@ def play_cards_audio(card_order):
         print("No known cards to play.")
         return
 
-    # Check if audio directory exists
-    if not os.path.exists(AUDIO_DIR):
+    # One directory listing instead of a stat() per card
+    available = scan_audio_files()
+    if available is None:
         print(f"\n⚠️  Audio directory not found: {AUDIO_DIR}")
         print("   Creating directory...")
         try:
@@ -272,19 +1032,16 @@ def play_cards_audio(card_order):
             print(f"  {i}. '{card}' -> could not extract code, skipping.")
             continue
 
-        filename = f"{code}.wav"
-        filepath = os.path.join(AUDIO_DIR, filename)
-
-        if os.path.exists(filepath):
+        filename = available.get(code)
+        if filename is not None:
             print(f"  {i}. {card} -> Playing {filename}...", end=" ", flush=True)
-            if play_wav(filepath):
+            if play_wav(os.path.join(AUDIO_DIR, filename), report=ConsoleFormatter.error):
                 print("✓")
                 played_count += 1
             else:
                 print("✗ Failed")
-            time.sleep(0.01)  # minimal pause between cards (10ms)
         else:
-            print(f"  {i}. {card} -> ⚠️  missing audio file: {filename}")
+            print(f"  {i}. {card} -> ⚠️  missing audio file: {code}.wav")
     
     if played_count == 0:
         print("\n⚠️  No audio files were played. Check that:")
@@ -297,6 +1054,25 @@ def play_cards_audio(card_order):
 
 # ---------- MAIN LOOP ---------- #
 
+@contextlib.contextmanager
+def open_capture(args):
+    """
+    Open the camera for --camera (yields None if that fails).
+
+    On exit - normal, error or Ctrl+C - the windows are closed first and the
+    camera released after, so no window is left holding a dead capture.
+    """
+    cap = open_camera(args.camera)
+    try:
+        yield cap
+    finally:
+        if not args.headless:
+            cv2.destroyAllWindows()
+        if cap is not None:
+            cap.release()
+            print("Camera released. Goodbye!")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Live QR Code Detection with USB Webcam")
     parser.add_argument(
@@ -307,9 +1083,11 @@ def main():
     )
     parser.add_argument(
         "--scale",
+        "--detect-scale",
+        dest="scale",
         type=float,
         default=0.75 if IS_RASPBERRY_PI else 1.0,
-        help="Scale factor for frame processing (default: 0.75 on Pi, 1.0 otherwise)",
+        help="Scale factor for the grayscale frame the detector sees; the display stays full size (default: 0.75 on Pi, 1.0 otherwise)",
     )
     parser.add_argument(
         "--window-name",
@@ -322,6 +1100,12 @@ def main():
         action="store_true",
         help="Run without display window (useful for headless Raspberry Pi)",
     )
+    parser.add_argument(
+        "--display-backend",
+        choices=["cv", "gl", "gst"],
+        default="cv",
+        help="How frames are shown: cv (cv2.imshow), gl (OpenGL window) or gst (GStreamer nvoverlaysink, Jetson) (default: cv)",
+    )
     parser.add_argument(
         "--width",
         type=int,
@@ -334,6 +1118,52 @@ def main():
         default=480 if IS_RASPBERRY_PI else 480,
         help="Camera frame height (default: 480)",
     )
+    parser.add_argument(
+        "--fourcc",
+        type=lambda s: "" if s.lower() == "none" else s.upper().ljust(4)[:4],
+        default="MJPG",
+        help='Camera pixel format to request, e.g. MJPG or YUYV; "none" keeps the driver default (default: MJPG)',
+    )
+    parser.add_argument(
+        "--capture-scaled",
+        action="store_true",
+        help="Capture at width x height x --scale instead of resizing every frame (smaller display, less USB/CPU traffic)",
+    )
+    parser.add_argument(
+        "--detect-every",
+        type=int,
+        default=DETECT_EVERY,
+        help=f"Run full QR detection every N frames and track corners in between (default: {DETECT_EVERY}, 1 = every frame)",
+    )
+    parser.add_argument(
+        "--decoder",
+        choices=["opencv", "pyzbar", "zxing"],
+        default="opencv",
+        help="QR decoding library (default: opencv; pyzbar/zxing are faster but optional installs)",
+    )
+    parser.add_argument(
+        "--opencl",
+        "--gpu",
+        dest="opencl",
+        action="store_true",
+        help="Run the OpenCV QR detector through OpenCL (UMat) if a GPU/OpenCL device is available",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=0,
+        help="OpenCV worker threads for QR detection (default: 0 = one per physical core)",
+    )
+    parser.add_argument(
+        "--pin-cores",
+        action="store_true",
+        help="Linux: pin the process to one CPU per physical core (also applies to the audio subprocesses)",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print every QR detection on every frame (default: each code once until reset)",
+    )
 
     args = parser.parse_args()
 
@@ -348,8 +1178,12 @@ def main():
             print("   Running in headless mode (no display window)")
 
     print(f"Initializing camera at index {args.camera}...")
-    cap = open_camera(args.camera)
+    with open_capture(args) as cap:
+        run_detection(args, cap)
 
+
+def run_detection(args, cap):
+    """Configure the opened camera and run the capture/detect/display loop."""
     if cap is None or not cap.isOpened():
         print(f"\nError: Could not open camera {args.camera}")
         print("Troubleshooting:")
@@ -362,9 +1196,23 @@ def main():
         return
 
     # Only set properties AFTER we know the camera is open
-    # Use lower resolution on Pi for better performance
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, args.width)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, args.height)
+    # Ask for MJPEG first (V4L2 applies FOURCC before the frame size): USB
+    # webcams deliver far fewer bytes per frame than raw YUYV
+    if args.fourcc:
+        try:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*args.fourcc))
+        except:
+            pass  # Some backends don't support this
+
+    # Use lower resolution on Pi for better performance. With
+    # --capture-scaled, ask the camera for the detector's resolution
+    # directly so no frame ever has to be downscaled.
+    capture_width, capture_height = args.width, args.height
+    if args.capture_scaled and args.scale < 1.0:
+        capture_width = int(args.width * args.scale)
+        capture_height = int(args.height * args.scale)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, capture_width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, capture_height)
     
     # Set buffer size to 1 to reduce latency (important for Pi)
     try:
@@ -383,11 +1231,23 @@ def main():
     ret, test_frame = cap.read()
     if not ret or test_frame is None:
         print("Error: Camera opened but cannot read frames.")
-        cap.release()
         return
 
     print("Camera ready!")
 
+    # Scale the detector input is actually resized by. args.scale stays as
+    # the user gave it (it is what the HUD shows); with --capture-scaled the
+    # camera may already have done some or all of the downscaling.
+    detect_scale = args.scale
+    if (capture_width, capture_height) != (args.width, args.height):
+        if test_frame.shape[1] <= capture_width:
+            print(f"Capturing at {test_frame.shape[1]}x{test_frame.shape[0]} - no per-frame resize needed")
+            detect_scale = 1.0
+        else:
+            # The camera has no mode that small - fall back to resizing
+            print(f"⚠️  Camera cannot capture at {capture_width}x{capture_height}; resizing frames instead")
+            detect_scale = args.scale * args.width / test_frame.shape[1]
+
     print("\nStarting video stream...")
     if not args.headless:
         print("Press 'q' to quit")
@@ -399,43 +1259,199 @@ def main():
         print("Press Ctrl+C to quit (headless mode)")
     print("-" * 50)
 
-    qr_detector = cv2.QRCodeDetector()
+    num_threads = configure_threads(args.threads, args.pin_cores)
+    if args.verbose:
+        ConsoleFormatter.info(f"OpenCV using {num_threads} thread(s)")
+
+    use_opencl = args.opencl and args.decoder == "opencv" and enable_opencl()
+    if not use_opencl:
+        # Otherwise OpenCV may still initialise the OpenCL runtime on the
+        # first call that has a kernel (a multi-second stall on Jetson)
+        cv2.ocl.setUseOpenCL(False)
+    decode_qr_codes = make_qr_decoder(args.decoder, use_opencl)
+
+    # Pick the scaled or native (--scale 1.0) helpers once here, so the
+    # frame loop has no per-frame / per-QR scale branches
+    if detect_scale != 1.0:
+        to_processing, to_display = downscale_gray, scale_corners
+    else:
+        to_processing, to_display = native_gray, native_corners
+
+    # Point scale factor from detector input back to the displayed frame
+    inv_scale = np.float32(1.0 / detect_scale)
+    if HAVE_NUMBA and detect_scale != 1.0:
+        # Compile (or load from cache) now rather than on the first QR seen
+        scale_corners(np.zeros((4, 2), dtype=np.float32), inv_scale)
+    if HAVE_NUMBA:
+        # Same for the box blend (on a view, like the ROIs it gets later)
+        blend_rect(np.zeros((4, 4, 3), dtype=np.uint8), (1, 1), (2, 2), (0, 0, 0), 0.5)
+
+    # Grayscale (and optionally downscaled) detector input, reused every frame
+    gray_buf, small_buf = alloc_processing_buffers(test_frame.shape, detect_scale)
+
+    # Thumbnails for the static-scene gate, plus the cached detector output
+    thumb_buf = np.empty((THUMB_SIZE, THUMB_SIZE), dtype=np.uint8)
+    prev_thumb = np.empty_like(thumb_buf)
+    last_detection = None  # (retval, decoded_info, points)
+    reused_frames = 0
+    miss_streak = 0  # detections in a row that found nothing
+
+    # Detection region around known cards (None = scan the full frame)
+    qr_roi = None
+    roi_scans = 0        # ROI-only detections since the last full scan
+    full_scan_found = 0  # codes decoded by the last full scan
+
+    # Previous detector input, for optical-flow tracking between detections
+    flow_prev = np.empty_like(small_buf if small_buf is not None else gray_buf)
+    tracked_frames = 0
+    max_tracked_frames = args.detect_every - 1  # tracked frames between detections
+
+    grabber = FrameGrabber(cap)  # started inside the try below
+    frame_seq = 0
+
+    # Pre-rendered static HUD text
+    last_show = 0.0  # time.monotonic() of the last cv2.imshow
+    display_writer = None
+    if not args.headless:
+        display_writer = open_display(args.display_backend, args.window_name, test_frame.shape)
+    hud_overlay = TextOverlay()
+    banner_overlay = TextOverlay()  # flop/turn/river text, rebuilt per new card
+    status_overlay = TextOverlay()  # top status line
+    progress_overlay = TextOverlay()  # "Poker: n/5" line before the flop
 
     frame_count = 0
     saved_count = 0
+    # Nothing is displayed (or saved - there are no keys) in headless mode
+    draw_annotations = not args.headless
+    save_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)  # 's' key saves
     debug_mode = False
 
+    # FPS measurement for debug mode
+    tick_freq = cv2.getTickFrequency()
+    last_tick = 0
+    avg_frame_time = 0.0  # smoothed seconds per frame
+
     # Poker state
-    unique_qr_codes = set()  # for fast membership checks
-    card_order = []          # preserves order of first-seen cards
+    card_order = {}          # first-seen cards, in order (dict: O(1) membership)
+    printed_qrs = set()      # codes already reported on the console
 
     flop_detected = False
-    flop_cards = []
+    flop_cards = ()          # tuple: used as-is in the banner cache key
     turn_detected = False
     turn_card = None
     river_detected = False
     river_card = None
 
     try:
+        # Capture runs on its own thread from here on; the finally stops it
+        # (and waits for it) before open_capture releases the camera
+        grabber.start()
         while True:
-            ret, frame = cap.read()
+            # Newest frame from the grabber thread (which uses grab() +
+            # retrieve() on a 1-frame driver buffer)
+            ret, frame, frame_seq = grabber.read(frame_seq)
 
             if not ret or frame is None:
                 print("Error: Failed to capture frame from USB webcam.")
                 break
 
-            # Optional scaling for speed
-            if args.scale != 1.0:
-                h, w = frame.shape[:2]
-                new_w = int(w * args.scale)
-                new_h = int(h * args.scale)
-                processing_frame = cv2.resize(frame, (new_w, new_h))
-            else:
-                processing_frame = frame
+            # The camera may hand us a different size than we asked for
+            # (or change it after a reconnect) - resize the buffers if so
+            if gray_buf.shape != frame.shape[:2]:
+                gray_buf, small_buf = alloc_processing_buffers(frame.shape, detect_scale)
+                flow_prev = np.empty_like(small_buf if small_buf is not None else gray_buf)
+                last_detection = None  # cached points are for the old size
+                qr_roi = None
 
-            annotated_frame = frame.copy()
+            # Detector works on a single-channel image: convert once into
+            # the preallocated buffer (1/3 of the bytes of BGR)
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray_buf)
 
-            retval, decoded_info, points, _ = qr_detector.detectAndDecodeMulti(processing_frame)
+            # Optional scaling for speed
+            processing_frame = to_processing(gray, small_buf)
+
+            # Draw straight onto the captured frame: detection below only
+            # reads processing_frame, and we are done with the pixels after
+            # this iteration, so a per-frame copy is not needed.
+            annotated_frame = frame
+
+            # Throttled display: a frame that is not going to be shown is
+            # not annotated either, unless it is about to be saved ('s')
+            key = -1
+            if display_writer is not None:
+                show_frame = True
+            elif not args.headless:
+                now = time.monotonic()
+                show_frame = now - last_show >= SHOW_INTERVAL
+                if not show_frame:
+                    # Nothing new to paint: just check for a key press
+                    key = poll_key() & 0xFF
+            else:
+                show_frame = False
+            annotate = draw_annotations and (show_frame or key == ord("s"))
+
+            # Skip the detector when the scene has not changed since the
+            # last detection (cards lying still on the table)
+            cv2.resize(
+                processing_frame,
+                (THUMB_SIZE, THUMB_SIZE),
+                dst=thumb_buf,
+                interpolation=cv2.INTER_AREA,
+            )
+            # Likewise while nothing has been found for a while, only look
+            # on every IDLE_DETECT_EVERY-th frame
+            idle_skip = miss_streak >= IDLE_MISS_STREAK and frame_count % IDLE_DETECT_EVERY != 0
+            if last_detection is not None and (
+                idle_skip
+                or (
+                    reused_frames < MAX_REUSED_FRAMES
+                    and cv2.norm(thumb_buf, prev_thumb, cv2.NORM_L1) < STATIC_FRAME_THRESHOLD
+                )
+            ):
+                retval, decoded_info, points = last_detection
+                reused_frames += 1
+            else:
+                # Between full detections, move the known QRs with optical
+                # flow (much cheaper than searching the whole frame)
+                tracked = None
+                if (
+                    last_detection is not None
+                    and last_detection[0]
+                    and tracked_frames < max_tracked_frames
+                ):
+                    tracked = track_qr_points(flow_prev, processing_frame, last_detection[2])
+
+                if tracked is not None:
+                    retval, decoded_info, points = last_detection[0], last_detection[1], tracked
+                    tracked_frames += 1
+                else:
+                    # Search only around the cards we already know about,
+                    # unless a periodic full-frame scan is due
+                    retval = False
+                    if (
+                        qr_roi is not None
+                        and roi_scans < FULL_SCAN_EVERY
+                        and not changed_outside_roi(thumb_buf, prev_thumb, qr_roi, processing_frame.shape)
+                    ):
+                        roi_result = decode_in_roi(decode_qr_codes, processing_frame, qr_roi, full_scan_found)
+                        if roi_result is not None:
+                            retval, decoded_info, points = roi_result
+                            roi_scans += 1
+
+                    if not retval:  # no ROI scan, or it lost a code - rescan everything
+                        retval, decoded_info, points = decode_qr_codes(processing_frame)
+                        full_scan_found = count_decoded(retval, decoded_info)
+                        roi_scans = 0
+
+                    qr_roi = roi_from_points(points, processing_frame.shape) if retval else None
+                    tracked_frames = 0
+                    reused_frames = 0
+                    miss_streak = 0 if retval else miss_streak + 1
+                    np.copyto(prev_thumb, thumb_buf)
+
+                last_detection = (retval, decoded_info, points)
+                # Points now refer to this image - track from it next time
+                np.copyto(flow_prev, processing_frame)
             detected_qrs = []
 
             if retval:
@@ -446,60 +1462,24 @@ def main():
                     formatted_data = format_qr_data(data)
                     detected_qrs.append({"data": formatted_data, "points": pts})
 
-                    # Scale points back if we resized
-                    if args.scale != 1.0:
-                        scaled_points = [
-                            (int(p[0] / args.scale), int(p[1] / args.scale)) for p in pts
-                        ]
-                    else:
-                        scaled_points = [(int(p[0]), int(p[1])) for p in pts]
-
-                    pts_array = np.array(scaled_points, dtype=np.int32)
-                    cv2.polylines(annotated_frame, [pts_array], True, (0, 255, 0), 2)
-
-                    for p in scaled_points:
-                        cv2.circle(annotated_frame, p, 5, (255, 0, 0), -1)
-
-                    text_x = min(p[0] for p in scaled_points)
-                    text_y = min(p[1] for p in scaled_points) - 10
-
-                    label = formatted_data[:50]
-                    if len(formatted_data) > 50:
-                        label += "..."
-
-                    (text_width, text_height), baseline = cv2.getTextSize(
-                        label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1
-                    )
-
-                    overlay = annotated_frame.copy()
-                    cv2.rectangle(
-                        overlay,
-                        (text_x, text_y - text_height - 5),
-                        (text_x + text_width + 5, text_y + baseline + 5),
-                        (0, 0, 0),
-                        -1,
-                    )
-                    cv2.addWeighted(overlay, 0.7, annotated_frame, 0.3, 0, annotated_frame)
+                    if annotate:
+                        # Scale points back if we resized, and find where the
+                        # label goes (Numba-compiled when available)
+                        pts_array, text_x, text_y = to_display(pts, inv_scale)
+                        draw_qr_annotation(annotated_frame, pts_array, text_x, text_y, formatted_data)
 
-                    cv2.putText(
-                        annotated_frame,
-                        label,
-                        (text_x, text_y),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.5,
-                        (0, 255, 0),
-                        1,
-                    )
-
-                    ConsoleFormatter.info(f"QR Code detected: {formatted_data}")
+                    # Console output is slow (locks + flushes stdout): report a
+                    # code once, not on every frame it stays in view
+                    if args.verbose or formatted_data not in printed_qrs:
+                        printed_qrs.add(formatted_data)
+                        ConsoleFormatter.info(f"QR Code detected: {formatted_data}")
 
             # --------- Poker logic with stable ordering  --------- #
-            # Add newly seen QR codes to both the set and the ordered list
+            # Add newly seen QR codes (dicts keep insertion order)
             for qr in detected_qrs:
                 card = qr["data"]
-                if card not in unique_qr_codes:
-                    unique_qr_codes.add(card)
-                    card_order.append(card)
+                if card not in card_order:
+                    card_order[card] = None
                     # Write new card to text file
                     try:
                         with open(CARDS_FILE, "a", encoding="utf-8") as f:
@@ -511,7 +1491,7 @@ def main():
 
             # FLOP: first 3 cards in detection order
             if current_count >= 3 and not flop_detected:
-                flop_cards = card_order[:3]
+                flop_cards = tuple(card_order)[:3]
                 flop_detected = True
                 ConsoleFormatter.header("FLOP DETECTED!", "🎰")
                 ConsoleFormatter.info(f"Card 1: {flop_cards[0]}", indent=3)
@@ -522,7 +1502,7 @@ def main():
 
             # TURN: 4th card in detection order
             if current_count >= 4 and not turn_detected:
-                turn_card = card_order[3]
+                turn_card = tuple(card_order)[3]
                 turn_detected = True
                 ConsoleFormatter.header("TURN DETECTED!", "🔄")
                 ConsoleFormatter.info(f"Turn Card: {turn_card}", indent=3)
@@ -531,7 +1511,7 @@ def main():
 
             # RIVER: 5th card in detection order
             if current_count >= 5 and not river_detected:
-                river_card = card_order[4]
+                river_card = tuple(card_order)[4]
                 river_detected = True
                 ConsoleFormatter.header("RIVER DETECTED!", "🌊")
                 ConsoleFormatter.info(f"River Card: {river_card}", indent=3)
@@ -549,211 +1529,74 @@ def main():
 
             # ----------------------------------------------------- #
 
-            info_text = f"Detected QR codes this frame: {len(detected_qrs)}"
-            if river_detected:
-                info_text += " | HAND COMPLETE! (5/5 cards)"
-            elif turn_detected:
-                info_text += " | TURN DETECTED! (4/5 cards)"
-            elif flop_detected:
-                info_text += " | FLOP DETECTED! (3/5 cards)"
-            else:
-                info_text += f" | Unique cards seen: {len(card_order)}/5"
-
-            cv2.putText(
-                annotated_frame,
-                info_text,
-                (10, 30),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.7,
-                (0, 255, 0),
-                2,
-            )
-
             frame_count += 1
-            cv2.putText(
-                annotated_frame,
-                f"Frame: {frame_count}",
-                (10, 60),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.7,
-                (255, 255, 255),
-                2,
-            )
-
-            if args.scale != 1.0:
-                cv2.putText(
-                    annotated_frame,
-                    f"Scale: {args.scale}x",
-                    (10, 90),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6,
-                    (128, 128, 128),
-                    1,
-                )
 
-            y_offset = 120
             if debug_mode:
+                # FPS readout (debug only). cv2.getTickCount is a cheap
+                # monotonic counter, no time.time() call per frame needed.
+                # Smooth the frame time, not 1/dt: averaging instantaneous
+                # rates is skewed upward by the odd very short frame gap.
+                tick = cv2.getTickCount()
+                if last_tick:
+                    dt = (tick - last_tick) / tick_freq
+                    avg_frame_time = dt if avg_frame_time == 0.0 else 0.9 * avg_frame_time + 0.1 * dt
+                last_tick = tick
+
+            # HUD and banner: only on frames that are shown or saved
+            if annotate:
+                # Same few strings frame after frame: stamp the cached pixels
+                # rather than re-rasterising ~60 glyphs
+                # (the stage follows from the card count: 3 flop, 4 turn, 5 river)
+                status_overlay.draw(annotated_frame, status_text_lines, len(detected_qrs), len(card_order))
+
                 cv2.putText(
                     annotated_frame,
-                    "Debug Mode: ON",
-                    (10, y_offset),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6,
-                    (0, 165, 255),
-                    2,
-                )
-                y_offset += 30
-
-            h, w = annotated_frame.shape[:2]
-
-            if river_detected:
-                box_y_start = h - 180
-                box_y_end = h - 10
-                box_x_start = 10
-                box_x_end = w - 10
-                overlay = annotated_frame.copy()
-                cv2.rectangle(overlay, (box_x_start, box_y_start), (box_x_end, box_y_end), (255, 0, 255), -1)
-                cv2.addWeighted(overlay, 0.3, annotated_frame, 0.7, 0, annotated_frame)
-                cv2.putText(
-                    annotated_frame,
-                    "🃏 HAND COMPLETE! 🃏",
-                    (20, box_y_start + 25),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.7,
-                    (255, 0, 255),
-                    2,
-                )
-                cv2.putText(
-                    annotated_frame,
-                    "Flop:",
-                    (20, box_y_start + 50),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (255, 255, 255),
-                    1,
-                )
-                for i, card in enumerate(flop_cards):
-                    cv2.putText(
-                        annotated_frame,
-                        f"  Card {i+1}: {card[:30]}",
-                        (20, box_y_start + 70 + (i * 20)),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.5,
-                        (255, 255, 255),
-                        1,
-                    )
-                cv2.putText(
-                    annotated_frame,
-                    f"Turn:  {turn_card[:30]}",
-                    (20, box_y_start + 135),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (255, 255, 255),
-                    1,
-                )
-                cv2.putText(
-                    annotated_frame,
-                    f"River: {river_card[:30]}",
-                    (20, box_y_start + 155),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (255, 255, 255),
-                    1,
-                )
-            elif turn_detected:
-                box_y_start = h - 160
-                box_y_end = h - 10
-                box_x_start = 10
-                box_x_end = w - 10
-                overlay = annotated_frame.copy()
-                cv2.rectangle(overlay, (box_x_start, box_y_start), (box_x_end, box_y_end), (0, 165, 255), -1)
-                cv2.addWeighted(overlay, 0.3, annotated_frame, 0.7, 0, annotated_frame)
-                cv2.putText(
-                    annotated_frame,
-                    "🔄 TURN DETECTED! 🔄",
-                    (20, box_y_start + 25),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.7,
-                    (0, 165, 255),
-                    2,
-                )
-                cv2.putText(
-                    annotated_frame,
-                    "Flop:",
-                    (20, box_y_start + 50),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (255, 255, 255),
-                    1,
-                )
-                for i, card in enumerate(flop_cards):
-                    cv2.putText(
-                        annotated_frame,
-                        f"  Card {i+1}: {card[:30]}",
-                        (20, box_y_start + 70 + (i * 20)),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.5,
-                        (255, 255, 255),
-                        1,
-                    )
-                cv2.putText(
-                    annotated_frame,
-                    f"Turn:  {turn_card[:30]}",
-                    (20, box_y_start + 135),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (255, 255, 255),
-                    1,
-                )
-            elif flop_detected:
-                box_y_start = h - 120
-                box_y_end = h - 10
-                box_x_start = 10
-                box_x_end = w - 10
-                overlay = annotated_frame.copy()
-                cv2.rectangle(overlay, (box_x_start, box_y_start), (box_x_end, box_y_end), (0, 255, 0), -1)
-                cv2.addWeighted(overlay, 0.3, annotated_frame, 0.7, 0, annotated_frame)
-                cv2.putText(
-                    annotated_frame,
-                    "🎰 FLOP DETECTED! 🎰",
-                    (20, box_y_start + 25),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.7,
-                    (0, 255, 0),
+                    f"Frame: {frame_count}",
+                    (10, 60),
+                    COUNTER_FONT,
+                    1.3,
+                    FRAME_COUNTER_COLOR,
                     2,
                 )
-                for i, card in enumerate(flop_cards):
-                    cv2.putText(
-                        annotated_frame,
-                        f"Card {i+1}: {card[:30]}",
-                        (20, box_y_start + 50 + (i * 25)),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.6,
-                        (255, 255, 255),
-                        2,
-                    )
-            else:
-                progress_text = f"Poker: {len(card_order)}/5 unique cards detected"
-                if len(card_order) > 0:
+
+                # Scale / debug labels: pre-rendered, only rebuilt on change
+                hud_overlay.draw(annotated_frame, static_hud_lines, args.scale, debug_mode)
+
+                y_offset = 120
+                if debug_mode:
+                    y_offset += 30
+
+                    fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0.0
                     cv2.putText(
                         annotated_frame,
-                        progress_text,
+                        f"FPS: {fps:.1f}",
                         (10, y_offset),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.6,
-                        (255, 255, 0),
+                        COUNTER_FONT,
+                        1.1,
+                        DEBUG_COLOR,
                         2,
                     )
+                    y_offset += 30
 
-            # Only show window if not in headless mode
-            if not args.headless:
+                if flop_detected:
+                    # turn_card / river_card are None until detected
+                    draw_poker_banner(annotated_frame, banner_overlay, flop_cards, turn_card, river_card)
+                else:
+                    if len(card_order) > 0:
+                        progress_overlay.draw(annotated_frame, progress_text_lines, len(card_order), y_offset)
+
+            # Only show window if not in headless mode. In headless mode
+            # key stays -1: no waiting for key input, and no sleep needed
+            # since grabber.read() blocks until the next frame.
+            if display_writer is not None:
+                # Overlay sink paces itself; there is no window for keys
+                display_writer.write(annotated_frame)
+            elif show_frame:
                 cv2.imshow(args.window_name, annotated_frame)
-                key = cv2.waitKey(1) & 0xFF  # 1ms delay for frame processing
-            else:
-                # In headless mode, don't wait for key input (non-blocking)
-                key = -1
-                # Small delay to prevent 100% CPU usage
-                time.sleep(0.01)
+                last_show = now
+                # waitKey pumps the GUI events that actually paint the
+                # window; its "1 ms" can take 10+ ms on some platforms
+                key = cv2.waitKey(1) & 0xFF
 
             if key == ord("q"):
                 print("\nQuitting...")
@@ -761,16 +1604,19 @@ def main():
             elif key == ord("s"):
                 saved_count += 1
                 filename = f"qr_detection_{saved_count}.jpg"
-                cv2.imwrite(filename, annotated_frame)
-                print(f"Saved frame to {filename}")
+                # Encode + write off the frame loop. Copy first: the frame
+                # buffer is reused by the grabber and drawn on next frame.
+                save_pool.submit(save_frame, filename, annotated_frame.copy())
             elif key == ord("d"):
                 debug_mode = not debug_mode
+                last_tick = 0  # don't count the time spent with debug off
+                avg_frame_time = 0.0
                 print(f"Debug mode {'enabled' if debug_mode else 'disabled'}")
             elif key == ord("r"):
-                unique_qr_codes.clear()
                 card_order.clear()
+                printed_qrs.clear()
                 flop_detected = False
-                flop_cards = []
+                flop_cards = ()
                 turn_detected = False
                 turn_card = None
                 river_detected = False
@@ -803,10 +1649,11 @@ def main():
     except KeyboardInterrupt:
         print("\nInterrupted by user")
     finally:
-        cap.release()
-        if not args.headless:
-            cv2.destroyAllWindows()
-        print("Camera released. Goodbye!")
+        grabber.stop()
+        save_pool.shutdown(wait=True)  # finish any pending saves
+        aplay_stream.close()
+        if display_writer is not None:
+            display_writer.release()
 
 
 if __name__ == "__main__":
@@ -32,9 +32,15 @@ import platform
 import argparse
 import random
 import os
-import subprocess
+import codecs
 from typing import List, Optional
 
+# Card audio playback (shared with live_qr_detector.py)
+try:
+    from .audio_playback import aplay_stream, play_wav
+except ImportError:  # run as a script rather than as part of the package
+    from audio_playback import aplay_stream, play_wav
+
 # Try to import pyserial
 try:
     import serial
@@ -170,6 +176,10 @@ class ConsoleFormatter:
 
 # ---------- AUDIO HELPERS ---------- #
 
+# Leading run of letters/digits (\w without "_", i.e. str.isalnum())
+CARD_CODE_RE = re.compile(r"[^\W_]+")
+
+
 def extract_card_code(card_str: str) -> str:
     """
     Extract a card code suitable for filename from the card string.
@@ -180,55 +190,8 @@ def extract_card_code(card_str: str) -> str:
       "  as  "     -> "AS"
     We take leading alphanumeric characters, uppercase them.
     """
-    s = card_str.strip().upper()
-    code = ""
-    for ch in s:
-        if ch.isalnum():
-            code += ch
-        else:
-            break
-    return code
-
-
-def play_wav(path: str) -> bool:
-    """
-    Play a .wav file using platform-appropriate audio player.
-    - macOS: uses 'afplay'
-    - Linux/Raspberry Pi: uses 'aplay'
-    - Windows: uses 'start' command
-    This call is blocking: it waits until the audio finishes.
-    
-    Returns:
-        True if successful, False otherwise
-    """
-    system = platform.system()
-    
-    try:
-        if system == "Darwin":  # macOS
-            subprocess.run(["afplay", path], check=True)
-        elif system == "Linux":
-            subprocess.run(["aplay", path], check=True)
-        elif system == "Windows":
-            subprocess.run(["start", "/WAIT", path], shell=True, check=True)
-        else:
-            ConsoleFormatter.warning(f"Unsupported OS '{system}'. Audio playback may not work.", indent=2)
-            return False
-        return True
-    except FileNotFoundError:
-        if system == "Darwin":
-            ConsoleFormatter.error("'afplay' not found. This is unusual on macOS.", indent=2)
-        elif system == "Linux":
-            ConsoleFormatter.error("'aplay' not found. Install ALSA utils with:", indent=2)
-            ConsoleFormatter.info("  sudo apt install alsa-utils", indent=3)
-        else:
-            ConsoleFormatter.error(f"Audio player not found for OS '{system}'", indent=2)
-        return False
-    except subprocess.CalledProcessError as e:
-        ConsoleFormatter.error(f"Error playing {path}: Command failed with return code {e.returncode}", indent=2)
-        return False
-    except Exception as e:
-        ConsoleFormatter.error(f"Error playing {path}: {e}", indent=2)
-        return False
+    m = CARD_CODE_RE.match(card_str.strip().upper())
+    return m.group(0) if m else ""
 
 
 def read_cards_from_file() -> List[str]:
@@ -238,16 +201,16 @@ def read_cards_from_file() -> List[str]:
     Returns:
         List of card strings, empty list if file doesn't exist or is empty
     """
-    if not os.path.exists(CARDS_FILE):
-        return []
-    
     try:
         with open(CARDS_FILE, "r", encoding="utf-8") as f:
-            cards = [line.strip() for line in f.readlines() if line.strip()]
-        return cards
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return []
     except Exception as e:
         ConsoleFormatter.error(f"Failed to read cards from file: {e}", indent=2)
         return []
+    
+    return [card for card in map(str.strip, lines) if card]
 
 
 def play_cards_audio(card_order: List[str]):
@@ -287,12 +250,11 @@ def play_cards_audio(card_order: List[str]):
 
         if os.path.exists(filepath):
             ConsoleFormatter.info(f"{i}. {card} -> Playing {filename}...", indent=3)
-            if play_wav(filepath):
+            if play_wav(filepath, report=lambda msg: ConsoleFormatter.error(msg, indent=2)):
                 ConsoleFormatter.success("✓", indent=5)
                 played_count += 1
             else:
                 ConsoleFormatter.error("✗ Failed", indent=5)
-            time.sleep(0.01)  # minimal pause between cards (10ms)
         else:
             ConsoleFormatter.warning(f"{i}. {card} -> missing audio file: {filename}", indent=3)
     
@@ -309,21 +271,39 @@ class PokerHandReader:
     """Reads and manages poker hands from QR code scanner input."""
     
     # Valid card ranks and suits
-    RANKS = {'A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K'}
-    SUITS = {'S', 'H', 'D', 'C'}  # Spades, Hearts, Diamonds, Clubs
+    RANKS = frozenset({'A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K'})
+    SUITS = frozenset({'S', 'H', 'D', 'C'})  # Spades, Hearts, Diamonds, Clubs
     
     # All 52 valid poker cards
-    VALID_CARDS = {
+    VALID_CARDS = frozenset({
         'AS', '2S', '3S', '4S', '5S', '6S', '7S', '8S', '9S', '10S', 'JS', 'QS', 'KS',
         'AH', '2H', '3H', '4H', '5H', '6H', '7H', '8H', '9H', '10H', 'JH', 'QH', 'KH',
         'AD', '2D', '3D', '4D', '5D', '6D', '7D', '8D', '9D', '10D', 'JD', 'QD', 'KD',
         'AC', '2C', '3C', '4C', '5C', '6C', '7C', '8C', '9C', '10C', 'JC', 'QC', 'KC'
+    })
+    CARD_LIST = tuple(VALID_CARDS)  # for random.sample() in test mode
+    
+    # Arduino (face, number) fields for each rank: face cards have a blank
+    # number, and 10 is sent as 1
+    RANK_FIELDS = {
+        'A': ('A', 'B'), 'J': ('J', 'B'), 'Q': ('Q', 'B'), 'K': ('K', 'B'),
+        '10': ('N', '1'),
+        **{rank: ('N', rank) for rank in '23456789'},
+    }
+    
+    # Characters stripped from scanner input before validation: a deletion
+    # table for str.translate (ASCII input), the regex for anything else
+    NON_CARD_CHARS = re.compile(r'[^A-Z0-9]')
+    NON_CARD_TABLE = {
+        c: None for c in range(128)
+        if not (ord('A') <= c <= ord('Z') or ord('0') <= c <= ord('9'))
     }
     
     def __init__(self, serial_conn=None):
         """Initialize the poker hand reader."""
         self.current_cards: List[str] = []         # Only keep 2 most recent cards
         self.card_count: int = 0                   # Total number of cards seen
+        self.pair_sent: bool = False               # current_cards already sent to Arduino
         self.serial = serial_conn                  # Serial connection to Arduino (or None)
     
     def card_to_list(self, card: str) -> List[str]:
@@ -344,24 +324,9 @@ class PokerHandReader:
         rank = card[:-1]  # Everything except last character (suit)
         suit = card[-1]   # Last character (suit)
         
-        # Map suit
-        suit_map = {'D': 'D', 'S': 'S', 'C': 'C', 'H': 'H'}
-        suit_char = suit_map.get(suit, 'D')
-        
-        # Determine face card and number
-        if rank == 'A':
-            return ['A', 'B', suit_char]
-        elif rank == 'J':
-            return ['J', 'B', suit_char]
-        elif rank == 'Q':
-            return ['Q', 'B', suit_char]
-        elif rank == 'K':
-            return ['K', 'B', suit_char]
-        elif rank == '10':
-            return ['N', '1', suit_char]  # 10 becomes 1
-        else:
-            # Number card (2-9)
-            return ['N', rank, suit_char]
+        face, number = self.RANK_FIELDS.get(rank, ('N', rank))
+        suit_char = suit if suit in self.SUITS else 'D'
+        return [face, number, suit_char]
     
     def send_hand_to_arduino(self, cards: List[str]) -> bool:
         """
@@ -408,8 +373,9 @@ class PokerHandReader:
             message = f"HAND:{hand_str}\n"
             
             ConsoleFormatter.info(f"Attempting to send: {message.strip()}", indent=5)
+            # write() hands the bytes to the kernel; no flush(), which
+            # would block until the UART has actually sent them
             self.serial.write(message.encode("ascii", errors="ignore"))
-            self.serial.flush()
             
             ConsoleFormatter.success(f"Sent to Arduino: HAND:{hand_str.strip()}", indent=3)
             ConsoleFormatter.info(f"Data: {hand_list}", indent=5)
@@ -440,11 +406,18 @@ class PokerHandReader:
         Returns:
             Valid card string (e.g., "AS") or None if invalid
         """
+        # Fast path: a scanner normally sends the card exactly as it is spelled
+        if input_str in self.VALID_CARDS:
+            return input_str
+        
         # Remove whitespace and convert to uppercase
         input_str = input_str.strip().upper()
         
         # Remove any non-alphanumeric characters
-        input_str = re.sub(r'[^A-Z0-9]', '', input_str)
+        if input_str.isascii():
+            input_str = input_str.translate(self.NON_CARD_TABLE)
+        else:
+            input_str = self.NON_CARD_CHARS.sub('', input_str)
         
         # Check if it's exactly 2 or 3 characters
         if len(input_str) < 2 or len(input_str) > 3:
@@ -482,6 +455,7 @@ class PokerHandReader:
         
         # Add the new card
         self.current_cards.append(card)
+        self.pair_sent = False
         
         # Keep only the 2 most recent cards
         if len(self.current_cards) > 2:
@@ -495,7 +469,9 @@ class PokerHandReader:
             ConsoleFormatter.info(f"Sending pair to Arduino (card_count={self.card_count} is even)", indent=3)
             ConsoleFormatter.info(f"Cards to send: {self.current_cards}", indent=5)
             success = self.send_hand_to_arduino(self.current_cards)
-            if not success:
+            if success:
+                self.pair_sent = True
+            else:
                 ConsoleFormatter.warning("Send failed - connection may be lost. Will retry on reconnect.", indent=3)
         elif len(self.current_cards) == 2:
             ConsoleFormatter.info(f"Have 2 cards but waiting (card_count={self.card_count} is odd)", indent=3)
@@ -516,11 +492,13 @@ class PokerHandReader:
     def store_hand(self):
         """Store and clear the current hand."""
         if len(self.current_cards) >= 2:
-            hand = self.get_hand()
+            # Only read before the clear below, so no copy is needed
+            hand = self.current_cards
             ConsoleFormatter.card(f"Hand stored: {', '.join(hand)}")
             
-            # Send hand to Arduino in list format (only when we have 2 cards)
-            if len(hand) == 2:
+            # Send hand to Arduino in list format (only when we have 2 cards
+            # and add_card has not already sent this pair)
+            if len(hand) == 2 and not self.pair_sent:
                 success = self.send_hand_to_arduino(hand)
                 if not success:
                     ConsoleFormatter.warning("Send failed - connection may be lost. Will retry on reconnect.", indent=3)
@@ -531,23 +509,24 @@ class PokerHandReader:
             )
         
         self.current_cards.clear()
+        self.pair_sent = False
         ConsoleFormatter.info("Hand reset. Ready for new cards.", indent=3)
         print()
     
     def reset(self):
         """Reset the current hand without storing it."""
         if self.current_cards:
-            ConsoleFormatter.reset(f"Resetting hand: {', '.join(self.get_hand())}")
+            ConsoleFormatter.reset(f"Resetting hand: {', '.join(self.current_cards)}")
         else:
             ConsoleFormatter.reset("Resetting empty hand.")
         self.current_cards.clear()
+        self.pair_sent = False
         self.card_count = 0  # Reset card counter
         
         # Send reset command to Arduino (single-letter 'R' per your current sketch)
         if self.serial is not None:
             try:
                 self.serial.write(b"R\n")
-                self.serial.flush()
                 ConsoleFormatter.info("Sent reset command 'R' to Arduino", indent=3)
             except (OSError, SerialExceptionType) as e:
                 ConsoleFormatter.error(f"Serial error sending reset to Arduino: {e}", indent=3)
@@ -564,7 +543,7 @@ class PokerHandReader:
         if self.current_cards:
             ConsoleFormatter.status(
                 f"Current cards ({len(self.current_cards)} card(s)): "
-                f"{', '.join(self.get_hand())}"
+                f"{', '.join(self.current_cards)}"
             )
             if len(self.current_cards) >= 2:
                 ConsoleFormatter.success("Hand complete! Will be stored on next card or reset.", indent=3)
@@ -573,18 +552,59 @@ class PokerHandReader:
         ConsoleFormatter.separator()
 
 
-def get_char(timeout=0.1):
+class SerialLineBuffer:
+    """
+    Arduino output read in whatever chunks the port has waiting, handed
+    out as complete lines. Replaces readline(), which could block for the
+    port timeout on a line the Arduino is still sending.
     """
-    Read a single character from stdin with optional timeout.
+
+    def __init__(self):
+        self._rx = bytearray()  # output not yet ended by a newline
+
+    def feed(self, data: bytes) -> List[str]:
+        """
+        Add data read from the port and return the lines it completed,
+        decoded and without their line ending ("\n" or "\r\n").
+        """
+        self._rx += data
+        *lines, self._rx = self._rx.split(b"\n")
+        return [line.decode("utf-8", errors="replace").rstrip() for line in lines]
+
+    def clear(self):
+        """Drop a partial line, e.g. after an I/O error (its rest never comes)."""
+        self._rx = bytearray()
+
+
+# Decodes stdin bytes as they arrive; keeps a multi-byte character that is
+# split across two reads intact
+STDIN_DECODER = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+def get_chars(timeout=0.1, wake_on=None, maxlen=16):
+    """
+    Read whatever characters are waiting on stdin, with optional timeout.
+    
+    A QR scanner types a whole card (e.g. "10H\r") in one burst, so this
+    returns all of it from a single read() instead of one character per
+    call.
     
     Args:
         timeout: Timeout in seconds (0.1 = 100ms)
+        wake_on: Optional extra file object (e.g. the Arduino serial port)
+            that also ends the wait when it has data
+        maxlen: Most bytes to read at once
         
     Returns:
-        Character read, or None if timeout
+        String of characters read, or None if timeout (or woken by wake_on)
     """
-    if select.select([sys.stdin], [], [], timeout)[0]:
-        return sys.stdin.read(1)
+    fd = sys.stdin.fileno()
+    fds = [fd] if wake_on is None else [fd, wake_on]
+    if fd in select.select(fds, [], [], timeout)[0]:
+        data = os.read(fd, maxlen)
+        if not data:
+            return "\x04"  # stdin closed - same as Ctrl+D
+        return STDIN_DECODER.decode(data) or None
     return None
 
 
@@ -609,9 +629,37 @@ def generate_random_hand() -> List[str]:
     Returns:
         List of 2 card strings (e.g., ["AS", "7H"])
     """
-    cards = list(PokerHandReader.VALID_CARDS)
-    hand = random.sample(cards, 2)
-    return hand
+    return random.sample(PokerHandReader.CARD_LIST, 2)
+
+
+def send_test_hand(reader: PokerHandReader, hand: List[str], indent: int = 2) -> Optional[bool]:
+    """
+    Feed a generated hand through the reader as if it had been scanned.
+    
+    add_card already sends the pair once the second card is in, so the
+    hand is only sent again here if that send did not go through.
+    
+    Args:
+        reader: PokerHandReader instance
+        hand: List of 2 card strings
+        indent: Indent for the "Would send" line when not connected
+        
+    Returns:
+        True if sent, False if the send failed, None if not connected
+    """
+    # Simulate adding cards to reader
+    reader.current_cards.clear()
+    reader.card_count = 0
+    for card in hand:
+        reader.add_card(card)
+    
+    if reader.serial is None:
+        # Show what would be sent
+        hand_list = reader.card_to_list(hand[0]) + reader.card_to_list(hand[1])
+        ConsoleFormatter.info(f"Would send: HAND:{','.join(hand_list)}", indent=indent)
+        return None
+    
+    return reader.pair_sent or reader.send_hand_to_arduino(hand)
 
 
 def run_test_mode(reader: PokerHandReader, ser=None):
@@ -666,27 +714,13 @@ def run_test_mode(reader: PokerHandReader, ser=None):
                 hand = generate_random_hand()
                 ConsoleFormatter.info(f"Generated random hand: {', '.join(hand)}", indent=2)
                 
-                # Simulate adding cards to reader
-                reader.current_cards.clear()
-                reader.card_count = 0
-                for card in hand:
-                    reader.add_card(card)
-                
-                # Send to Arduino if connected
-                if reader.serial is not None:
-                    success = reader.send_hand_to_arduino(hand)
-                    if success:
-                        ConsoleFormatter.success("Hand sent successfully!", indent=2)
-                    else:
-                        ConsoleFormatter.warning("Failed to send hand (serial may be disconnected)", indent=2)
-                else:
-                    # Show what would be sent
-                    card1_list = reader.card_to_list(hand[0])
-                    card2_list = reader.card_to_list(hand[1])
-                    hand_list = card1_list + card2_list
-                    hand_str = ",".join(hand_list)
-                    ConsoleFormatter.info(f"Would send: HAND:{hand_str}", indent=2)
+                success = send_test_hand(reader, hand, indent=2)
+                if success is None:
                     ConsoleFormatter.warning("Serial not connected - data not sent", indent=2)
+                elif success:
+                    ConsoleFormatter.success("Hand sent successfully!", indent=2)
+                else:
+                    ConsoleFormatter.warning("Failed to send hand (serial may be disconnected)", indent=2)
                 
                 print()
                 
@@ -714,25 +748,11 @@ def run_test_mode(reader: PokerHandReader, ser=None):
                         hand = generate_random_hand()
                         ConsoleFormatter.info(f"Hand {i+1}/{n}: {', '.join(hand)}", indent=2)
                         
-                        # Simulate adding cards
-                        reader.current_cards.clear()
-                        reader.card_count = 0
-                        for card in hand:
-                            reader.add_card(card)
-                        
-                        # Send to Arduino if connected
-                        if reader.serial is not None:
-                            success = reader.send_hand_to_arduino(hand)
-                            if success:
-                                ConsoleFormatter.success("Sent!", indent=4)
-                            else:
-                                ConsoleFormatter.warning("Send failed", indent=4)
-                        else:
-                            card1_list = reader.card_to_list(hand[0])
-                            card2_list = reader.card_to_list(hand[1])
-                            hand_list = card1_list + card2_list
-                            hand_str = ",".join(hand_list)
-                            ConsoleFormatter.info(f"Would send: HAND:{hand_str}", indent=4)
+                        success = send_test_hand(reader, hand, indent=4)
+                        if success:
+                            ConsoleFormatter.success("Sent!", indent=4)
+                        elif success is not None:
+                            ConsoleFormatter.warning("Send failed", indent=4)
                         
                         if i < n - 1:
                             time.sleep(0.5)  # Small delay between hands
@@ -792,6 +812,38 @@ def show_startup_menu():
     return choice
 
 
+def handle_card_input(reader: PokerHandReader, input_buffer: str, card: Optional[str]):
+    """
+    Finish one card entry from the scanner/keyboard: add the card and show
+    the hand once it is complete, or report the input as invalid.
+    
+    Args:
+        reader: PokerHandReader instance
+        input_buffer: The characters that were entered
+        card: Result of reader.validate_card(input_buffer), None if invalid
+    """
+    if card is None:
+        ConsoleFormatter.error(
+            f"Invalid card: '{input_buffer}' (not in 52 valid cards)",
+            indent=2
+        )
+        return
+    
+    ConsoleFormatter.input_msg(f"Processed: '{input_buffer}' -> {card}")
+    reader.add_card(card)
+    
+    # At least 2 cards - the hand is "ready"
+    if len(reader.current_cards) >= 2:
+        print()
+        ConsoleFormatter.success(
+            f"Hand complete! ({len(reader.current_cards)} cards)"
+        )
+        ConsoleFormatter.info(
+            f"Hand: {', '.join(reader.current_cards)}",
+            indent=3
+        )
+
+
 def main():
     """Main function to run the poker hand reader."""
     parser = argparse.ArgumentParser(description="Poker Hand Reader with Arduino output")
@@ -812,18 +864,29 @@ def main():
         action="store_true",
         help="Skip menu and go directly to test mode",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Echo every typed character and the input buffer (default: only processed cards)",
+    )
     args = parser.parse_args()
 
     # Serial connection and auto-reconnect state
     ser = None
     last_serial_attempt = 0.0
-    RECONNECT_INTERVAL = 5.0  # seconds between reconnect attempts
+    serial_lines = SerialLineBuffer()  # Arduino output, split into lines
+    RECONNECT_MIN = 0.5       # first reconnect delay, doubled after each failure
+    RECONNECT_MAX = 30.0      # longest delay between reconnect attempts
+    reconnect_delay = RECONNECT_MIN
+    ARDUINO_BOOT_TIME = 2.0   # the Arduino resets when the port is opened
+    serial_ready_at = 0.0     # when the freshly opened port may be used
+    IDLE_WAIT = 1.0           # longest input wait with nothing buffered (reconnect checks)
 
     reader = PokerHandReader(serial_conn=None)
 
     def attempt_serial_connect(force: bool = False):
         """Try to (re)open the serial port if needed."""
-        nonlocal ser, last_serial_attempt
+        nonlocal ser, last_serial_attempt, reconnect_delay, serial_ready_at
 
         if not HAVE_SERIAL:
             return
@@ -831,8 +894,8 @@ def main():
         if not args.serial_port:
             return
 
-        now = time.time()
-        if not force and now - last_serial_attempt < RECONNECT_INTERVAL:
+        now = time.monotonic()
+        if not force and now - last_serial_attempt < reconnect_delay:
             return
 
         last_serial_attempt = now
@@ -846,10 +909,12 @@ def main():
                 f"Opening serial port {args.serial_port} at {args.baudrate} baud..."
             )
             s = serial.Serial(args.serial_port, args.baudrate, timeout=0.1)
-            # Wait a bit for Arduino to reboot when serial opens
-            time.sleep(2)
+            # The Arduino reboots when the port opens. Rather than sleeping
+            # through that, the port is only handed to the reader (for
+            # sends and reads) once serial_ready_at has passed.
             ser = s
-            reader.serial = ser
+            serial_ready_at = now + ARDUINO_BOOT_TIME
+            reconnect_delay = RECONNECT_MIN
             ConsoleFormatter.success(
                 f"Connected to Arduino on {args.serial_port} at {args.baudrate} baud"
             )
@@ -859,9 +924,18 @@ def main():
             )
             ser = None
             reader.serial = None
+            # Back off while the Arduino stays away; the jitter keeps the
+            # retries from settling into a fixed rhythm
+            reconnect_delay = min(
+                RECONNECT_MAX, reconnect_delay * 2 * random.uniform(0.8, 1.2)
+            )
 
     # Initial connection attempt
     attempt_serial_connect(force=True)
+    if ser is not None:
+        # Nothing else is running yet, so just wait for the boot here
+        time.sleep(max(0.0, serial_ready_at - time.monotonic()))
+        reader.serial = ser
     
     # Show startup menu unless --test-mode flag is used
     if args.test_mode:
@@ -908,26 +982,28 @@ def main():
         
         # Flush any buffered input before starting
         time.sleep(0.1)
-        while select.select([sys.stdin], [], [], 0)[0]:
-            try:
-                sys.stdin.read(1)
-            except Exception:
-                break
+        termios.tcflush(fd, termios.TCIFLUSH)
         
         while True:
             try:
                 # Attempt reconnect if serial is currently down
                 if ser is None or reader.serial is None:
                     attempt_serial_connect(force=False)
-                    # Ensure reader has the latest serial connection
-                    reader.serial = ser
+                    # Hand the connection to the reader once the Arduino
+                    # has booted; keep reading the scanner meanwhile. A
+                    # rate-limited attempt leaves ser as it was, which can be
+                    # a port the reader already closed after a send error
+                    if ser is not None and ser.is_open and time.monotonic() >= serial_ready_at:
+                        reader.serial = ser
 
                 # --- Read anything the Arduino prints (if connected) ---
                 if ser is not None and reader.serial is not None:
                     try:
-                        # Drain all waiting lines so we don't fall behind
-                        while ser.in_waiting:
-                            line = ser.readline().decode("utf-8", errors="replace").rstrip()
+                        # Take everything waiting in one read and handle the
+                        # lines it completes
+                        waiting = ser.in_waiting
+                        lines = serial_lines.feed(ser.read(waiting)) if waiting else ()
+                        for line in lines:
                             if line:
                                 ConsoleFormatter.arduino(line)
                                 
@@ -958,13 +1034,23 @@ def main():
                             pass
                         ser = None
                         reader.serial = None
+                        serial_lines.clear()
                         # Force next reconnect attempt quickly
                         last_serial_attempt = 0.0
 
                 # --- QR scanner / keyboard input handling ---
-                char = get_char(timeout=0.1)
+                # stdout stays line-buffered; one flush per iteration, before
+                # blocking, pushes out anything printed without a newline
+                sys.stdout.flush()
+                if input_buffer:
+                    # Short timeout: a pause ends the card/command
+                    chars = get_chars(timeout=0.1)
+                else:
+                    # Idle: sleep until a key or Arduino output arrives
+                    # instead of waking up 10 times a second
+                    chars = get_chars(timeout=IDLE_WAIT, wake_on=reader.serial)
                 
-                if char is None:
+                if chars is None:
                     # Timeout - check if we should process the buffer
                     if input_buffer:
                         # Check for standalone commands (R, Q, S) - only if single character
@@ -991,124 +1077,78 @@ def main():
                         # Process as card if we have 2+ characters
                         if len(input_buffer) >= 2:
                             card = reader.validate_card(input_buffer)
-                            
-                            if card:
-                                ConsoleFormatter.input_msg(
-                                    f"Processed: '{input_buffer}' -> {card}"
-                                )
-                                reader.add_card(card)
-                                
-                                # If at least 2 cards, hand is automatically sent to Arduino
-                                if len(reader.current_cards) >= 2:
-                                    print()
-                                    ConsoleFormatter.success(
-                                        f"Hand complete! ({len(reader.current_cards)} cards)"
-                                    )
-                                    ConsoleFormatter.info(
-                                        f"Hand: {', '.join(reader.get_hand())}",
-                                        indent=3
-                                    )
-                            else:
-                                ConsoleFormatter.error(
-                                    f"Invalid card: '{input_buffer}' (not in 52 valid cards)",
-                                    indent=2
-                                )
-                            
+                            handle_card_input(reader, input_buffer, card)
                             input_buffer = ""
                     continue
                 
-                # Handle special control characters
-                if ord(char) == 3:  # Ctrl+C
-                    print("\n")
-                    ConsoleFormatter.info("Exiting...")
-                    break
-                
-                if ord(char) == 4:  # Ctrl+D (EOF)
-                    print("\n")
-                    ConsoleFormatter.info("Exiting...")
-                    break
-                
-                # Handle Enter/Return key
-                if char == '\r' or char == '\n':
-                    if input_buffer:
-                        # Process what we have
-                        card = reader.validate_card(input_buffer)
-                        
-                        if card:
+                # The whole burst goes through the same per-character
+                # handling as before
+                quit_requested = False
+                for char in chars:
+                    code = ord(char)
+                    
+                    # Handle special control characters
+                    if code == 3:  # Ctrl+C
+                        print("\n")
+                        ConsoleFormatter.info("Exiting...")
+                        quit_requested = True
+                        break
+                    
+                    if code == 4:  # Ctrl+D (EOF)
+                        print("\n")
+                        ConsoleFormatter.info("Exiting...")
+                        quit_requested = True
+                        break
+                    
+                    # Handle Enter/Return key
+                    if char == '\r' or char == '\n':
+                        if input_buffer:
+                            # Process what we have
+                            card = reader.validate_card(input_buffer)
                             print()
-                            ConsoleFormatter.input_msg(
-                                f"Processed: '{input_buffer}' -> {card}"
-                            )
-                            reader.add_card(card)
-                            
-                            if len(reader.current_cards) >= 2:
-                                print()
-                                ConsoleFormatter.success(
-                                    f"Hand complete! ({len(reader.current_cards)} cards)"
-                                )
-                                ConsoleFormatter.info(
-                                    f"Hand: {', '.join(reader.get_hand())}",
-                                    indent=3
+                            handle_card_input(reader, input_buffer, card)
+                            input_buffer = ""
+                    
+                    # Handle backspace
+                    elif code == 127 or code == 8:  # Backspace
+                        if input_buffer:
+                            input_buffer = input_buffer[:-1]
+                            if args.verbose:
+                                print(
+                                    f"{ConsoleFormatter.PREFIX_INPUT}Backspace (buffer: '{input_buffer}')",
+                                    end='\r'
                                 )
-                        else:
-                            print()
-                            ConsoleFormatter.error(
-                                f"Invalid card: '{input_buffer}' (not in 52 valid cards)",
-                                indent=2
-                            )
-                        
-                        input_buffer = ""
-                
-                # Handle backspace
-                elif ord(char) == 127 or ord(char) == 8:  # Backspace
-                    if input_buffer:
-                        input_buffer = input_buffer[:-1]
-                        print(
-                            f"{ConsoleFormatter.PREFIX_INPUT}Backspace (buffer: '{input_buffer}')",
-                            end='\r'
-                        )
-                
-                # Handle printable characters
-                elif char.isprintable():
-                    # Add character to buffer first (for card input)
-                    input_buffer += char
-                    print(
-                        f"{ConsoleFormatter.PREFIX_INPUT}Char: '{char}' (buffer: '{input_buffer}')",
-                        end='\r'
-                    )
                     
-                    # If we have 2 or 3 characters, validate immediately
-                    if len(input_buffer) >= 2:
-                        card = reader.validate_card(input_buffer)
-                        
-                        if card:
-                            # Valid card found - process it
-                            print()
-                            ConsoleFormatter.input_msg(
-                                f"Processed: '{input_buffer}' -> {card}"
+                    # Handle printable characters
+                    elif char.isprintable():
+                        # Add character to buffer first (for card input)
+                        input_buffer += char
+                        # Per-keystroke echo is a TTY write for every
+                        # character of every scan - only on request
+                        if args.verbose:
+                            print(
+                                f"{ConsoleFormatter.PREFIX_INPUT}Char: '{char}' (buffer: '{input_buffer}')",
+                                end='\r'
                             )
-                            reader.add_card(card)
+                        
+                        # If we have 2 or 3 characters, validate immediately.
+                        # Every card ends in its suit, so only a suit letter
+                        # can complete one ("1", "10" need no lookup).
+                        if len(input_buffer) >= 2:
+                            if char.upper() in reader.SUITS:
+                                card = reader.validate_card(input_buffer)
+                            else:
+                                card = None
                             
-                            # Check if we have at least 2 cards - hand is "ready"
-                            if len(reader.current_cards) >= 2:
+                            # A valid card, or 3 characters and still not
+                            # valid - either way this entry is finished
+                            if card or len(input_buffer) == 3:
                                 print()
-                                ConsoleFormatter.success(
-                                    f"Hand complete! ({len(reader.current_cards)} cards)"
-                                )
-                                ConsoleFormatter.info(
-                                    f"Hand: {', '.join(reader.get_hand())}",
-                                    indent=3
-                                )
-                            
-                            input_buffer = ""
-                        elif len(input_buffer) == 3:
-                            # 3 characters and still not valid - invalid card
-                            print()
-                            ConsoleFormatter.error(
-                                f"Invalid card: '{input_buffer}' (not in 52 valid cards)",
-                                indent=2
-                            )
-                            input_buffer = ""
+                                handle_card_input(reader, input_buffer, card)
+                                input_buffer = ""
+                
+                if quit_requested:
+                    break
                 
             except KeyboardInterrupt:
                 print("\n\nExiting...")
@@ -1120,6 +1160,8 @@ def main():
                 break
     
     finally:
+        aplay_stream.close()
+        
         # Restore terminal settings
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
         
@@ -0,0 +1,41 @@
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")  # live_qr_detector exits on import without it
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import live_qr_detector as lqd  # noqa: E402
+
+
+def test_empty_roi_scan_after_undecoded_full_scan():
+    # The full scan located a code but could not decode it: retval is True
+    # and full_scan_found is 0. An ROI scan that then finds nothing at all
+    # must fall back to a full scan, not try to offset points=None.
+    img = np.zeros((480, 640), dtype=np.uint8)
+    corners = np.float32([[[100, 100], [200, 100], [200, 200], [100, 200]]])
+    results = iter([(True, ("",), corners), (False, (), None)])
+
+    def decode(_img):
+        return next(results)
+
+    retval, decoded_info, points = decode(img)
+    full_scan_found = lqd.count_decoded(retval, decoded_info)
+    assert full_scan_found == 0
+
+    roi = lqd.roi_from_points(points, img.shape)
+    assert lqd.decode_in_roi(decode, img, roi, full_scan_found) is None
+
+
+def test_roi_scan_points_are_in_full_frame_coordinates():
+    img = np.zeros((480, 640), dtype=np.uint8)
+    local = np.float32([[[5, 5], [50, 5], [50, 50], [5, 50]]])
+
+    def decode(_img):
+        return True, ("AS",), local
+
+    retval, decoded_info, points = lqd.decode_in_roi(decode, img, (100, 200, 80, 80), 1)
+    assert retval and decoded_info == ("AS",)
+    np.testing.assert_array_equal(points, local + np.float32((100, 200)))
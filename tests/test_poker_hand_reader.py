@@ -0,0 +1,224 @@
+import os
+import re
+import sys
+
+import pytest
+
+pytest.importorskip("termios")  # the reader puts a TTY in raw mode
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import poker_hand_reader as phr  # noqa: E402
+
+
+class FakeSerial:
+    """Stands in for serial.Serial: records what is written to the Arduino."""
+
+    def __init__(self):
+        self.is_open = True
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(data)
+        return len(data)
+
+    def close(self):
+        self.is_open = False
+
+    def hands(self):
+        return [w for w in self.writes if w.startswith(b"HAND:")]
+
+
+@pytest.fixture
+def reader():
+    return phr.PokerHandReader(serial_conn=FakeSerial())
+
+
+def test_pair_sent_once_by_add_card_then_store_hand(reader):
+    reader.add_card("AS")
+    reader.add_card("7H")
+    assert reader.pair_sent
+    reader.store_hand()
+    assert reader.serial.hands() == [b"HAND:A,B,S,N,7,H\n"]
+
+
+def test_store_hand_sends_pair_add_card_did_not(reader):
+    # Third card: the count is odd, so add_card holds the new pair back
+    for card in ("AS", "7H", "KD"):
+        reader.add_card(card)
+    assert not reader.pair_sent
+    reader.store_hand()
+    assert reader.serial.hands() == [b"HAND:A,B,S,N,7,H\n", b"HAND:N,7,H,K,B,D\n"]
+
+
+def test_store_hand_sends_after_failed_send(reader):
+    ser = reader.serial
+    reader.serial = None  # link down while the pair comes in
+    reader.add_card("AS")
+    reader.add_card("7H")
+    assert not reader.pair_sent
+    reader.serial = ser
+    reader.store_hand()
+    assert ser.hands() == [b"HAND:A,B,S,N,7,H\n"]
+
+
+def test_reset_rearms(reader):
+    reader.add_card("AS")
+    reader.add_card("7H")
+    reader.reset()
+    assert not reader.pair_sent
+    reader.add_card("AS")
+    reader.add_card("7H")
+    assert reader.serial.writes == [b"HAND:A,B,S,N,7,H\n", b"R\n", b"HAND:A,B,S,N,7,H\n"]
+
+
+def test_store_hand_clear_rearms(reader):
+    reader.add_card("AS")
+    reader.add_card("7H")
+    reader.store_hand()
+    assert not reader.pair_sent
+    reader.add_card("AS")
+    reader.add_card("7H")
+    reader.store_hand()
+    assert reader.serial.hands() == [b"HAND:A,B,S,N,7,H\n", b"HAND:A,B,S,N,7,H\n"]
+
+
+def test_serial_line_split_across_reads():
+    buf = phr.SerialLineBuffer()
+    assert buf.feed(b"RIV") == []
+    assert buf.feed(b"ER\n") == ["RIVER"]
+
+
+def test_serial_several_lines_in_one_read():
+    buf = phr.SerialLineBuffer()
+    assert buf.feed(b"ready\nHAND OK\nRIV") == ["ready", "HAND OK"]
+    assert buf.feed(b"ER\n") == ["RIVER"]
+
+
+def test_serial_trailing_carriage_return():
+    # Serial.println() ends lines with "\r\n"
+    buf = phr.SerialLineBuffer()
+    assert buf.feed(b"RIVER\r\n") == ["RIVER"]
+    assert buf.feed(b"a\r") == []
+    assert buf.feed(b"\nb\r\n") == ["a", "b"]
+
+
+def test_serial_buffer_reset_after_io_error():
+    buf = phr.SerialLineBuffer()
+    buf.feed(b"RIV")
+    buf.clear()  # what the main loop does when the port fails
+    assert buf.feed(b"ready\n") == ["ready"]
+
+
+@pytest.fixture
+def stdin_pipe(monkeypatch):
+    """stdin replaced by a pipe; yields the write end."""
+    r, w = os.pipe()
+    phr.STDIN_DECODER.reset()
+    with os.fdopen(r, "rb", buffering=0) as stdin:
+        monkeypatch.setattr(sys, "stdin", stdin)
+        yield w
+    try:
+        os.close(w)
+    except OSError:
+        pass  # the test closed it already
+    phr.STDIN_DECODER.reset()
+
+
+def test_get_chars_reads_whole_burst(stdin_pipe):
+    os.write(stdin_pipe, b"10H\r")
+    assert phr.get_chars(timeout=1.0) == "10H\r"
+
+
+def test_get_chars_multibyte_split_across_reads(stdin_pipe):
+    heart = "♥".encode("utf-8")  # 3 bytes
+    os.write(stdin_pipe, heart[:2])
+    assert phr.get_chars(timeout=1.0) is None  # nothing complete yet
+    os.write(stdin_pipe, heart[2:] + b"H")
+    assert phr.get_chars(timeout=1.0) == "♥H"
+
+
+def test_get_chars_maxlen(stdin_pipe):
+    os.write(stdin_pipe, b"ASKD")
+    assert phr.get_chars(timeout=1.0, maxlen=2) == "AS"
+    assert phr.get_chars(timeout=1.0, maxlen=2) == "KD"
+
+
+def test_get_chars_eof_is_ctrl_d(stdin_pipe):
+    os.close(stdin_pipe)
+    assert phr.get_chars(timeout=1.0) == "\x04"
+
+
+def test_get_chars_timeout_returns_nothing(stdin_pipe):
+    # Documented as None, which the main loop checks for
+    assert phr.get_chars(timeout=0.01) is None
+
+
+# validate_card as it was before the str.translate fast path
+def _old_validate_card(input_str):
+    input_str = input_str.strip().upper()
+    input_str = re.sub(r'[^A-Z0-9]', '', input_str)
+    if len(input_str) < 2 or len(input_str) > 3:
+        return None
+    if input_str in phr.PokerHandReader.VALID_CARDS:
+        return input_str
+    return None
+
+
+ALL_CARDS = sorted(phr.PokerHandReader.CARD_LIST)
+
+
+def _scanner_variants(card):
+    return [
+        card,
+        card.lower(),
+        f"  {card.lower()}\r\n",   # scanner line ending
+        f"[{card}]",
+        "-".join(card),
+        f"\x1b{card}\t",
+    ]
+
+
+@pytest.mark.parametrize("card", ALL_CARDS)
+def test_validate_card_matches_old_for_every_card(card):
+    reader = phr.PokerHandReader()
+    for text in _scanner_variants(card):
+        assert reader.validate_card(text) == _old_validate_card(text) == card, repr(text)
+
+
+@pytest.mark.parametrize("text", [
+    "10x", "10X", "10", "1OH", "", "A", "ASX", "11H", "0H",
+    "ß", "ÄS", "A♥S", "１0H", "1 0 h", "\t10d\n",
+])
+def test_validate_card_matches_old_on_odd_input(text):
+    assert phr.PokerHandReader().validate_card(text) == _old_validate_card(text)
+
+
+# card_to_list as it was before the RANK_FIELDS table
+def _old_card_to_list(card):
+    rank = card[:-1]
+    suit = card[-1]
+    suit_map = {'D': 'D', 'S': 'S', 'C': 'C', 'H': 'H'}
+    suit_char = suit_map.get(suit, 'D')
+    if rank == 'A':
+        return ['A', 'B', suit_char]
+    elif rank == 'J':
+        return ['J', 'B', suit_char]
+    elif rank == 'Q':
+        return ['Q', 'B', suit_char]
+    elif rank == 'K':
+        return ['K', 'B', suit_char]
+    elif rank == '10':
+        return ['N', '1', suit_char]
+    else:
+        return ['N', rank, suit_char]
+
+
+@pytest.mark.parametrize("card", ALL_CARDS + ["10x", "10X", "as", "7h", "1H", "ZZ"])
+def test_card_to_list_matches_old(card):
+    assert phr.PokerHandReader().card_to_list(card) == _old_card_to_list(card)
+
+
+def test_card_to_list_returns_fresh_lists():
+    reader = phr.PokerHandReader()
+    reader.card_to_list("AS").append("x")
+    assert reader.card_to_list("AS") == ["A", "B", "S"]